@@ -23,19 +23,19 @@ def export_to_csv(records: list[ConstituentRecord], output_path: Path) -> None:
     # Sort by ticker alphabetically
     sorted_records = sorted(records, key=lambda r: r.ticker)
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
+    # Large write buffer so rows are flushed in a few big writes instead of per row
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=1024 * 1024) as f:
         writer = csv.writer(f)
         writer.writerow(["ticker", "company_name", "added_date", "removed_date"])
-
-        for record in sorted_records:
-            writer.writerow(
-                [
-                    record.ticker,
-                    record.company_name or "",
-                    record.added_date.isoformat() if record.added_date else "",
-                    record.removed_date.isoformat() if record.removed_date else "",
-                ]
+        writer.writerows(
+            (
+                record.ticker,
+                record.company_name or "",
+                record.added_date.isoformat() if record.added_date else "",
+                record.removed_date.isoformat() if record.removed_date else "",
             )
+            for record in sorted_records
+        )
 
 
 def main() -> None:
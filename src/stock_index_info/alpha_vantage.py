@@ -1,21 +1,64 @@
 """Alpha Vantage API client for fetching income statement data."""
 
+import asyncio
 import logging
 import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Optional
+from itertools import pairwise
+from typing import Any, Optional
 
 from curl_cffi import requests
 import yfinance as yf
 
 from stock_index_info.config import ALPHA_VANTAGE_API_KEY
-from stock_index_info.db import get_cached_income, save_income
+from stock_index_info.db import (
+    get_cached_income,
+    get_cached_income_bulk,
+    save_income,
+    save_income_bulk,
+)
 from stock_index_info.exchange_rate import convert_to_usd
-from stock_index_info.models import IncomeRecord, PEResult
+from stock_index_info.models import CachedIncome, IncomeRecord, PEResult
 
 logger = logging.getLogger(__name__)
 
+# Alpha Vantage query endpoint shared by every function
+_ALPHA_VANTAGE_URL = "https://www.alphavantage.co/query"
+
+# Shared HTTP session so repeated Alpha Vantage calls reuse one TLS/TCP connection
+_session: Optional[requests.Session] = None
+
+# Market-cap cache TTL in seconds; quotes drift intraday, so keep it short
+_MARKET_CAP_TTL_SECONDS = 15 * 60
+
+# Cache market caps to absorb repeat queries for the same ticker
+# Maps uppercase ticker to (market_cap, unix timestamp when fetched)
+_market_cap_cache: dict[str, tuple[float, float]] = {}
+
+
+def clear_market_cap_cache() -> None:
+    """Clear the cached market caps. Useful for testing or long-running processes."""
+    _market_cap_cache.clear()
+
+
+def _get_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+
+# (threshold, reciprocal divisor, suffix) from largest to smallest magnitude;
+# multiplying by the precomputed reciprocal avoids a division per call
+_CURRENCY_MAGNITUDES: tuple[tuple[float, float, str], ...] = (
+    (1_000_000_000, 1 / 1_000_000_000, "B"),
+    (1_000_000, 1 / 1_000_000, "M"),
+    (10_000, 1 / 1_000, "K"),
+)
+
 
 def format_currency(amount: float) -> str:
     """Format a dollar amount in a compact human-readable format.
@@ -26,18 +69,161 @@ def format_currency(amount: float) -> str:
     Returns:
         Formatted string like "$12.5B", "$500.0M", "$50.0K", or "$5000"
     """
-    negative = amount < 0
     abs_amount = abs(amount)
-    prefix = "-" if negative else ""
+    prefix = "-" if amount < 0 else ""
+
+    for threshold, reciprocal, suffix in _CURRENCY_MAGNITUDES:
+        if abs_amount >= threshold:
+            return f"{prefix}${abs_amount * reciprocal:.1f}{suffix}"
+    return f"{prefix}${int(abs_amount)}"
+
+
+def _query_alpha_vantage(
+    function: str,
+    ticker_upper: str,
+    caller: str,
+) -> Optional[dict[str, Any]]:
+    """Issue a single Alpha Vantage query and return the decoded payload.
+
+    Centralizes the missing-API-key guard, shared session, latency logging,
+    and error handling that every sync endpoint otherwise duplicates.
+
+    Args:
+        function: Alpha Vantage function name (e.g., "INCOME_STATEMENT")
+        ticker_upper: Uppercase stock ticker symbol
+        caller: Calling function name, used as the log prefix
+
+    Returns:
+        Decoded JSON payload, or None if the key is missing or the request failed.
+    """
+    if not ALPHA_VANTAGE_API_KEY:
+        logger.error(
+            f"[API] {caller}({ticker_upper}): ALPHA_VANTAGE_API_KEY not configured, "
+            "skipping request"
+        )
+        return None
+
+    params = {
+        "function": function,
+        "symbol": ticker_upper,
+        "apikey": ALPHA_VANTAGE_API_KEY,
+    }
+
+    logger.info(f"[API] {caller}({ticker_upper}): requesting Alpha Vantage {function}")
+    start_time = time.time()
+
+    try:
+        response = _get_session().get(_ALPHA_VANTAGE_URL, params=params, timeout=30)
+        elapsed_ms = (time.time() - start_time) * 1000
+        response.raise_for_status()
+        data: dict[str, Any] = response.json()
+
+        logger.info(
+            f"[API] {caller}({ticker_upper}): "
+            f"response status={response.status_code}, elapsed={elapsed_ms:.0f}ms"
+        )
+        return data
+    except requests.RequestsError as e:
+        elapsed_ms = (time.time() - start_time) * 1000
+        logger.error(
+            f"[API] {caller}({ticker_upper}): "
+            f"request failed after {elapsed_ms:.0f}ms - {type(e).__name__}: {e}"
+        )
+        return None
+    except Exception as e:
+        elapsed_ms = (time.time() - start_time) * 1000
+        logger.error(
+            f"[API] {caller}({ticker_upper}): "
+            f"unexpected error after {elapsed_ms:.0f}ms - {type(e).__name__}: {e}",
+            exc_info=True,
+        )
+        return None
 
-    if abs_amount >= 1_000_000_000:
-        return f"{prefix}${abs_amount / 1_000_000_000:.1f}B"
-    elif abs_amount >= 1_000_000:
-        return f"{prefix}${abs_amount / 1_000_000:.1f}M"
-    elif abs_amount >= 10_000:
-        return f"{prefix}${abs_amount / 1_000:.1f}K"
-    else:
-        return f"{prefix}${int(abs_amount)}"
+
+def _parse_income_payload(ticker_upper: str, data: dict[str, Any]) -> Optional[list[IncomeRecord]]:
+    """Parse an Alpha Vantage INCOME_STATEMENT payload into IncomeRecord objects.
+
+    Net income values are converted to USD if reported in a different currency.
+
+    Args:
+        ticker_upper: Uppercase stock ticker symbol
+        data: Decoded JSON response body
+
+    Returns:
+        List of IncomeRecord sorted by fiscal_year descending (net_income in USD),
+        or None if the payload contains an error or no usable records.
+    """
+    # Check for error responses (single dict probe per key)
+    if (error_message := data.get("Error Message")) is not None:
+        logger.warning(
+            f"[API] fetch_annual_net_income({ticker_upper}): API returned error: {error_message}"
+        )
+        return None
+    if (note := data.get("Note")) is not None:
+        logger.warning(
+            f"[API] fetch_annual_net_income({ticker_upper}): API rate limit or note: {note}"
+        )
+        return None
+
+    annual_reports = data.get("annualReports", [])
+    if not annual_reports:
+        logger.warning(
+            f"[API] fetch_annual_net_income({ticker_upper}): no annualReports in response"
+        )
+        return None
+
+    records: list[IncomeRecord] = []
+
+    # Get reported currency from the first report (same for all reports)
+    reported_currency = annual_reports[0].get("reportedCurrency", "USD")
+    if reported_currency != "USD":
+        logger.info(f"{ticker_upper} reports in {reported_currency}, will convert to USD")
+
+    for entry in annual_reports:
+        fiscal_date = entry.get("fiscalDateEnding", "")
+        net_income_str = entry.get("netIncome", "")
+
+        # Skip entries with missing or invalid data
+        if not fiscal_date or not net_income_str or net_income_str == "None":
+            continue
+
+        try:
+            fiscal_year = int(fiscal_date[:4])
+            net_income = float(net_income_str)
+
+            # Convert to USD if necessary
+            if reported_currency != "USD":
+                net_income_usd = convert_to_usd(net_income, reported_currency)
+                if net_income_usd is None:
+                    logger.warning(
+                        f"Failed to convert {ticker_upper} net income from {reported_currency} to USD"
+                    )
+                    return None
+                net_income = net_income_usd
+
+            records.append(
+                IncomeRecord(
+                    ticker=ticker_upper,
+                    fiscal_year=fiscal_year,
+                    net_income=net_income,
+                )
+            )
+        except (ValueError, TypeError):
+            continue
+
+    if not records:
+        logger.warning(
+            f"[API] fetch_annual_net_income({ticker_upper}): no valid records after parsing"
+        )
+        return None
+
+    # Sort by fiscal year descending
+    records.sort(key=lambda r: r.fiscal_year, reverse=True)
+    logger.info(
+        f"[API] fetch_annual_net_income({ticker_upper}): "
+        f"successfully parsed {len(records)} annual records"
+    )
+    return records
 
 
 def fetch_annual_net_income(ticker: str) -> Optional[list[IncomeRecord]]:
@@ -54,6 +240,28 @@ def fetch_annual_net_income(ticker: str) -> Optional[list[IncomeRecord]]:
     """
     ticker_upper = ticker.upper()
 
+    data = _query_alpha_vantage("INCOME_STATEMENT", ticker_upper, "fetch_annual_net_income")
+    if data is None:
+        return None
+    return _parse_income_payload(ticker_upper, data)
+
+
+async def fetch_annual_net_income_async(
+    session: requests.AsyncSession,
+    ticker: str,
+) -> Optional[list[IncomeRecord]]:
+    """Async variant of fetch_annual_net_income using a shared AsyncSession.
+
+    Args:
+        session: curl_cffi AsyncSession shared across concurrent fetches
+        ticker: Stock ticker symbol (e.g., "AAPL")
+
+    Returns:
+        List of IncomeRecord sorted by fiscal_year descending (net_income in USD),
+        or None if API key not configured or ticker not found.
+    """
+    ticker_upper = ticker.upper()
+
     if not ALPHA_VANTAGE_API_KEY:
         logger.error(
             f"[API] fetch_annual_net_income({ticker_upper}): "
@@ -61,10 +269,9 @@ def fetch_annual_net_income(ticker: str) -> Optional[list[IncomeRecord]]:
         )
         return None
 
-    url = "https://www.alphavantage.co/query"
     params = {
         "function": "INCOME_STATEMENT",
-        "symbol": ticker.upper(),
+        "symbol": ticker_upper,
         "apikey": ALPHA_VANTAGE_API_KEY,
     }
 
@@ -74,7 +281,7 @@ def fetch_annual_net_income(ticker: str) -> Optional[list[IncomeRecord]]:
     start_time = time.time()
 
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = await session.get(_ALPHA_VANTAGE_URL, params=params, timeout=30)
         elapsed_ms = (time.time() - start_time) * 1000
         response.raise_for_status()
         data = response.json()
@@ -84,79 +291,7 @@ def fetch_annual_net_income(ticker: str) -> Optional[list[IncomeRecord]]:
             f"response status={response.status_code}, elapsed={elapsed_ms:.0f}ms"
         )
 
-        # Check for error responses
-        if "Error Message" in data:
-            logger.warning(
-                f"[API] fetch_annual_net_income({ticker_upper}): "
-                f"API returned error: {data.get('Error Message')}"
-            )
-            return None
-        if "Note" in data:
-            logger.warning(
-                f"[API] fetch_annual_net_income({ticker_upper}): "
-                f"API rate limit or note: {data.get('Note')}"
-            )
-            return None
-
-        annual_reports = data.get("annualReports", [])
-        if not annual_reports:
-            logger.warning(
-                f"[API] fetch_annual_net_income({ticker_upper}): no annualReports in response"
-            )
-            return None
-
-        records: list[IncomeRecord] = []
-
-        # Get reported currency from the first report (same for all reports)
-        reported_currency = annual_reports[0].get("reportedCurrency", "USD")
-        if reported_currency != "USD":
-            logger.info(f"{ticker_upper} reports in {reported_currency}, will convert to USD")
-
-        for entry in annual_reports:
-            fiscal_date = entry.get("fiscalDateEnding", "")
-            net_income_str = entry.get("netIncome", "")
-
-            # Skip entries with missing or invalid data
-            if not fiscal_date or not net_income_str or net_income_str == "None":
-                continue
-
-            try:
-                fiscal_year = int(fiscal_date[:4])
-                net_income = float(net_income_str)
-
-                # Convert to USD if necessary
-                if reported_currency != "USD":
-                    net_income_usd = convert_to_usd(net_income, reported_currency)
-                    if net_income_usd is None:
-                        logger.warning(
-                            f"Failed to convert {ticker_upper} net income from {reported_currency} to USD"
-                        )
-                        return None
-                    net_income = net_income_usd
-
-                records.append(
-                    IncomeRecord(
-                        ticker=ticker_upper,
-                        fiscal_year=fiscal_year,
-                        net_income=net_income,
-                    )
-                )
-            except (ValueError, TypeError):
-                continue
-
-        if not records:
-            logger.warning(
-                f"[API] fetch_annual_net_income({ticker_upper}): no valid records after parsing"
-            )
-            return None
-
-        # Sort by fiscal year descending
-        records.sort(key=lambda r: r.fiscal_year, reverse=True)
-        logger.info(
-            f"[API] fetch_annual_net_income({ticker_upper}): "
-            f"successfully parsed {len(records)} annual records"
-        )
-        return records
+        return _parse_income_payload(ticker_upper, data)
 
     except requests.RequestsError as e:
         elapsed_ms = (time.time() - start_time) * 1000
@@ -175,6 +310,56 @@ def fetch_annual_net_income(ticker: str) -> Optional[list[IncomeRecord]]:
         return None
 
 
+async def fetch_annual_net_income_many(
+    tickers: list[str],
+    concurrency: int = 25,
+) -> dict[str, Optional[list[IncomeRecord]]]:
+    """Fetch annual net income for many tickers concurrently.
+
+    Fans out fetch_annual_net_income_async over a single AsyncSession, bounded
+    by a semaphore so the Alpha Vantage rate limit is respected. Wall time is
+    roughly O(RTT * N / concurrency) instead of O(N * RTT) for sequential calls.
+
+    Args:
+        tickers: Stock ticker symbols
+        concurrency: Maximum number of in-flight requests (tune to API tier)
+
+    Returns:
+        Dict mapping uppercase ticker to its records, or None where a fetch failed.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(
+        session: requests.AsyncSession, ticker: str
+    ) -> Optional[list[IncomeRecord]]:
+        async with semaphore:
+            return await fetch_annual_net_income_async(session, ticker)
+
+    async with requests.AsyncSession() as session:
+        tasks = [asyncio.create_task(fetch_one(session, ticker)) for ticker in tickers]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    output: dict[str, Optional[list[IncomeRecord]]] = {}
+    for ticker, result in zip(tickers, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                f"[API] fetch_annual_net_income_many({ticker.upper()}): "
+                f"task failed - {type(result).__name__}: {result}"
+            )
+            output[ticker.upper()] = None
+        else:
+            output[ticker.upper()] = result
+    return output
+
+
+def fetch_annual_net_income_bulk(
+    tickers: list[str],
+    concurrency: int = 25,
+) -> dict[str, Optional[list[IncomeRecord]]]:
+    """Sync wrapper around fetch_annual_net_income_many for non-async callers."""
+    return asyncio.run(fetch_annual_net_income_many(tickers, concurrency=concurrency))
+
+
 def get_market_cap(ticker: str) -> Optional[float]:
     """Get current market capitalization.
 
@@ -188,6 +373,17 @@ def get_market_cap(ticker: str) -> Optional[float]:
     """
     ticker_upper = ticker.upper()
 
+    # Serve from cache if the quote is recent enough
+    entry = _market_cap_cache.get(ticker_upper)
+    if entry is not None:
+        cached_cap, fetched_at = entry
+        age = time.time() - fetched_at
+        if age < _MARKET_CAP_TTL_SECONDS:
+            logger.debug(
+                f"[API] get_market_cap({ticker_upper}): using cached value (age: {age:.0f}s)"
+            )
+            return cached_cap
+
     # Try yfinance first
     logger.info(f"[API] get_market_cap({ticker_upper}): requesting from yfinance")
     yf_start_time = time.time()
@@ -195,14 +391,13 @@ def get_market_cap(ticker: str) -> Optional[float]:
         stock = yf.Ticker(ticker_upper)
         info = stock.info
         yf_elapsed_ms = (time.time() - yf_start_time) * 1000
-        if info and "marketCap" in info:
-            market_cap = info["marketCap"]
-            if market_cap is not None:
-                logger.info(
-                    f"[API] get_market_cap({ticker_upper}): "
-                    f"yfinance returned {market_cap}, elapsed={yf_elapsed_ms:.0f}ms"
-                )
-                return float(market_cap)
+        if info and (market_cap := info.get("marketCap")) is not None:
+            logger.info(
+                f"[API] get_market_cap({ticker_upper}): "
+                f"yfinance returned {market_cap}, elapsed={yf_elapsed_ms:.0f}ms"
+            )
+            _market_cap_cache[ticker_upper] = (float(market_cap), time.time())
+            return float(market_cap)
         logger.warning(
             f"[API] get_market_cap({ticker_upper}): "
             f"yfinance returned no marketCap, elapsed={yf_elapsed_ms:.0f}ms"
@@ -223,54 +418,89 @@ def get_market_cap(ticker: str) -> Optional[float]:
         return None
 
     logger.info(f"[API] get_market_cap({ticker_upper}): falling back to Alpha Vantage OVERVIEW")
-    av_start_time = time.time()
 
-    try:
-        url = "https://www.alphavantage.co/query"
-        params = {
-            "function": "OVERVIEW",
-            "symbol": ticker_upper,
-            "apikey": ALPHA_VANTAGE_API_KEY,
-        }
-        response = requests.get(url, params=params, timeout=30)
-        av_elapsed_ms = (time.time() - av_start_time) * 1000
-        response.raise_for_status()
-        data = response.json()
-
-        logger.info(
-            f"[API] get_market_cap({ticker_upper}): "
-            f"Alpha Vantage OVERVIEW response status={response.status_code}, elapsed={av_elapsed_ms:.0f}ms"
-        )
-
-        if "MarketCapitalization" in data:
-            market_cap_str = data["MarketCapitalization"]
-            if market_cap_str and market_cap_str != "None":
-                market_cap = float(market_cap_str)
-                logger.info(
-                    f"[API] get_market_cap({ticker_upper}): Alpha Vantage returned {market_cap}"
-                )
-                return market_cap
-
-        logger.warning(
-            f"[API] get_market_cap({ticker_upper}): "
-            "Alpha Vantage OVERVIEW has no MarketCapitalization"
-        )
+    data = _query_alpha_vantage("OVERVIEW", ticker_upper, "get_market_cap")
+    if data is None:
         return None
-    except requests.RequestsError as e:
-        av_elapsed_ms = (time.time() - av_start_time) * 1000
+
+    try:
+        market_cap_str = data.get("MarketCapitalization")
+        if market_cap_str and market_cap_str != "None":
+            market_cap = float(market_cap_str)
+            logger.info(
+                f"[API] get_market_cap({ticker_upper}): Alpha Vantage returned {market_cap}"
+            )
+            _market_cap_cache[ticker_upper] = (market_cap, time.time())
+            return market_cap
+    except (ValueError, TypeError) as e:
         logger.error(
             f"[API] get_market_cap({ticker_upper}): "
-            f"Alpha Vantage request failed after {av_elapsed_ms:.0f}ms - {type(e).__name__}: {e}"
+            f"invalid MarketCapitalization value - {type(e).__name__}: {e}"
         )
         return None
+
+    logger.warning(
+        f"[API] get_market_cap({ticker_upper}): Alpha Vantage OVERVIEW has no MarketCapitalization"
+    )
+    return None
+
+
+def get_market_caps(tickers: list[str], max_workers: int = 8) -> dict[str, Optional[float]]:
+    """Get current market capitalization for many tickers in one batch.
+
+    Builds a single yf.Tickers object so every lookup shares one yfinance
+    HTTP session, then resolves the per-ticker quotes from a thread pool
+    because each .info access still blocks on its own request. Tickers the
+    batch misses fall back to the per-ticker get_market_cap path
+    (yfinance, then Alpha Vantage OVERVIEW).
+
+    Args:
+        tickers: Stock ticker symbols
+        max_workers: Maximum number of concurrent quote lookups
+
+    Returns:
+        Dict mapping uppercase ticker to market cap in dollars, or None
+        where no source had a value.
+    """
+    tickers_upper = [t.upper() for t in tickers]
+    if not tickers_upper:
+        return {}
+
+    logger.info(f"[API] get_market_caps(): requesting {len(tickers_upper)} tickers from yfinance")
+    start_time = time.time()
+
+    batch: Optional[yf.Tickers] = None
+    try:
+        batch = yf.Tickers(" ".join(tickers_upper))
     except Exception as e:
-        av_elapsed_ms = (time.time() - av_start_time) * 1000
-        logger.error(
-            f"[API] get_market_cap({ticker_upper}): "
-            f"unexpected error after {av_elapsed_ms:.0f}ms - {type(e).__name__}: {e}",
-            exc_info=True,
+        logger.warning(
+            f"[API] get_market_caps(): yfinance batch construction failed - {type(e).__name__}: {e}"
         )
-        return None
+
+    def resolve(ticker: str) -> Optional[float]:
+        if batch is not None:
+            try:
+                info = batch.tickers[ticker].info
+                raw_cap = info.get("marketCap") if info else None
+                if raw_cap is not None:
+                    return float(raw_cap)
+            except Exception as e:
+                logger.warning(
+                    f"[API] get_market_caps({ticker}): batch lookup failed - "
+                    f"{type(e).__name__}: {e}"
+                )
+        return get_market_cap(ticker)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers_upper))) as executor:
+        results = dict(zip(tickers_upper, executor.map(resolve, tickers_upper)))
+
+    elapsed_ms = (time.time() - start_time) * 1000
+    found = sum(1 for v in results.values() if v is not None)
+    logger.info(
+        f"[API] get_market_caps(): resolved {found}/{len(tickers_upper)} tickers, "
+        f"elapsed={elapsed_ms:.0f}ms"
+    )
+    return results
 
 
 def calculate_7year_avg_pe(
@@ -295,11 +525,9 @@ def calculate_7year_avg_pe(
     # Take the 7 most recent years
     recent_7 = income_records[:7]
 
-    # Check for consecutive years
-    years = [r.fiscal_year for r in recent_7]
-    for i in range(len(years) - 1):
-        if years[i] - years[i + 1] != 1:
-            return None
+    # Check for consecutive years (single pairwise pass, no intermediate list)
+    if any(a.fiscal_year - b.fiscal_year != 1 for a, b in pairwise(recent_7)):
+        return None
 
     avg_net_income = sum(r.net_income for r in recent_7) / 7
 
@@ -315,6 +543,7 @@ def get_7year_pe(
     ticker: str,
     market_cap: Optional[float] = None,
     latest_filing_date: Optional[str] = None,
+    cached: Optional[CachedIncome] = None,
 ) -> Optional[PEResult]:
     """Get 7-year average P/E ratio for a ticker.
 
@@ -327,21 +556,23 @@ def get_7year_pe(
         market_cap: Current market cap (fetched via yfinance if not provided)
         latest_filing_date: Latest SEC filing date (ISO format). If newer than
                            cache last_updated, triggers cache refresh.
+        cached: Pre-fetched cache entry (e.g., from get_cached_income_bulk).
+                Skips the per-call SELECT when provided.
 
     Returns:
         PEResult with 7-year average P/E ratio and average income, or None if insufficient data.
     """
     ticker_upper = ticker.upper()
 
-    # Get cached data
-    cached = get_cached_income(conn, ticker_upper)
-
-    # Determine if we need to refresh cache
-    need_refresh = False
+    # Get cached data unless the caller prefetched it
     if cached is None:
-        need_refresh = True
-    elif latest_filing_date and latest_filing_date > cached.last_updated:
-        need_refresh = True
+        cached = get_cached_income(conn, ticker_upper)
+
+    # Short-circuit the network fetch whenever the cache exists and no SEC
+    # filing is newer than it; only then is a refresh worth the API call
+    need_refresh = cached is None or bool(
+        latest_filing_date and latest_filing_date > cached.last_updated
+    )
 
     # Refresh cache if needed
     if need_refresh:
@@ -349,7 +580,12 @@ def get_7year_pe(
         if new_records:
             today = date.today().isoformat()
             save_income(conn, ticker_upper, new_records, today)
-            cached = get_cached_income(conn, ticker_upper)
+            # We already hold the rows we just wrote; no need to read them back
+            cached = CachedIncome(
+                ticker=ticker_upper,
+                last_updated=today,
+                annual_income=new_records,
+            )
 
     # Check if we have enough data
     if cached is None or len(cached.annual_income) < 7:
@@ -362,3 +598,69 @@ def get_7year_pe(
             return None
 
     return calculate_7year_avg_pe(cached.annual_income, market_cap)
+
+
+def get_7year_pe_bulk(
+    conn: sqlite3.Connection,
+    tickers: list[str],
+    market_caps: dict[str, Optional[float]],
+    latest_filing_dates: Optional[dict[str, str]] = None,
+    concurrency: int = 25,
+) -> dict[str, Optional[PEResult]]:
+    """Get 7-year average P/E ratios for many tickers in one batch.
+
+    Prefetches all cache rows with a single query, refreshes stale tickers
+    concurrently via the Alpha Vantage async fetcher, and saves the new
+    records in one transaction before computing the per-ticker ratios.
+
+    Args:
+        conn: Database connection
+        tickers: Stock ticker symbols
+        market_caps: Current market cap per uppercase ticker, as returned
+                     by get_market_caps (None where no source had a value)
+        latest_filing_dates: Latest SEC filing date per uppercase ticker
+                             (ISO format), used for cache invalidation
+        concurrency: Maximum number of in-flight API requests
+
+    Returns:
+        Dict mapping uppercase ticker to PEResult, or None where data is
+        insufficient or the market cap is unknown.
+    """
+    tickers_upper = [t.upper() for t in tickers]
+    filing_dates = {k.upper(): v for k, v in (latest_filing_dates or {}).items()}
+
+    # One SELECT for all tickers instead of N round-trips
+    cached_map = get_cached_income_bulk(conn, tickers_upper)
+
+    # Determine which tickers need a refresh
+    need_refresh: list[str] = []
+    for ticker in tickers_upper:
+        cached = cached_map.get(ticker)
+        if cached is None:
+            need_refresh.append(ticker)
+        else:
+            filing_date = filing_dates.get(ticker)
+            if filing_date and filing_date > cached.last_updated:
+                need_refresh.append(ticker)
+
+    # Refresh stale tickers concurrently and persist in one transaction
+    if need_refresh:
+        fetched = fetch_annual_net_income_bulk(need_refresh, concurrency=concurrency)
+        to_save = {ticker: records for ticker, records in fetched.items() if records}
+        if to_save:
+            today = date.today().isoformat()
+            save_income_bulk(conn, to_save, today)
+            for ticker, records in to_save.items():
+                cached_map[ticker] = CachedIncome(
+                    ticker=ticker, last_updated=today, annual_income=records
+                )
+
+    results: dict[str, Optional[PEResult]] = {}
+    for ticker in tickers_upper:
+        cached = cached_map.get(ticker)
+        market_cap = market_caps.get(ticker)
+        if cached is None or len(cached.annual_income) < 7 or market_cap is None:
+            results[ticker] = None
+            continue
+        results[ticker] = calculate_7year_avg_pe(cached.annual_income, market_cap)
+    return results
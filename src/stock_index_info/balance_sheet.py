@@ -4,20 +4,40 @@ import logging
 import sqlite3
 import time
 from datetime import date
-from typing import Optional
+from typing import Any, Optional
 
 from curl_cffi import requests
 
+from stock_index_info.alpha_vantage import _get_session
 from stock_index_info.config import ALPHA_VANTAGE_API_KEY
-from stock_index_info.db import get_cached_balance_sheet, save_balance_sheet
-from stock_index_info.exchange_rate import convert_to_usd
+from stock_index_info.db import (
+    get_cached_balance_sheet,
+    get_cached_balance_sheet_bulk,
+    save_balance_sheet,
+)
+from stock_index_info.exchange_rate import get_usd_conversion_rate
 from stock_index_info.models import (
     AssetValuationResult,
     BalanceSheetRecord,
+    CachedBalanceSheet,
 )
 
 logger = logging.getLogger(__name__)
 
+# Alpha Vantage query endpoint
+_ALPHA_VANTAGE_URL = "https://www.alphavantage.co/query"
+
+
+def _get_float(entry: dict[str, Any], key: str) -> Optional[float]:
+    """Parse a numeric report field, treating "None"/empty as 0."""
+    val = entry.get(key, "0")
+    if val is None or val == "None" or val == "":
+        return 0.0
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return None
+
 
 def fetch_balance_sheet(ticker: str) -> Optional[list[BalanceSheetRecord]]:
     """Fetch annual balance sheet data from Alpha Vantage BALANCE_SHEET API.
@@ -40,10 +60,9 @@ def fetch_balance_sheet(ticker: str) -> Optional[list[BalanceSheetRecord]]:
         )
         return None
 
-    url = "https://www.alphavantage.co/query"
     params = {
         "function": "BALANCE_SHEET",
-        "symbol": ticker.upper(),
+        "symbol": ticker_upper,
         "apikey": ALPHA_VANTAGE_API_KEY,
     }
 
@@ -53,7 +72,7 @@ def fetch_balance_sheet(ticker: str) -> Optional[list[BalanceSheetRecord]]:
     start_time = time.time()
 
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = _get_session().get(_ALPHA_VANTAGE_URL, params=params, timeout=30)
         elapsed_ms = (time.time() - start_time) * 1000
         response.raise_for_status()
         data = response.json()
@@ -63,17 +82,15 @@ def fetch_balance_sheet(ticker: str) -> Optional[list[BalanceSheetRecord]]:
             f"response status={response.status_code}, elapsed={elapsed_ms:.0f}ms"
         )
 
-        # Check for error responses
-        if "Error Message" in data:
+        # Check for error responses (single dict probe per key)
+        if (error_message := data.get("Error Message")) is not None:
             logger.warning(
-                f"[API] fetch_balance_sheet({ticker_upper}): "
-                f"API returned error: {data.get('Error Message')}"
+                f"[API] fetch_balance_sheet({ticker_upper}): API returned error: {error_message}"
             )
             return None
-        if "Note" in data:
+        if (note := data.get("Note")) is not None:
             logger.warning(
-                f"[API] fetch_balance_sheet({ticker_upper}): "
-                f"API rate limit or note: {data.get('Note')}"
+                f"[API] fetch_balance_sheet({ticker_upper}): API rate limit or note: {note}"
             )
             return None
 
@@ -86,29 +103,29 @@ def fetch_balance_sheet(ticker: str) -> Optional[list[BalanceSheetRecord]]:
 
         records: list[BalanceSheetRecord] = []
 
-        # Get reported currency from the first report
+        # Get reported currency from the first report; resolve the USD factor
+        # once so every field below converts with a single multiplication
         reported_currency = annual_reports[0].get("reportedCurrency", "USD")
+        usd_factor = 1.0
         if reported_currency != "USD":
             logger.info(f"{ticker_upper} reports in {reported_currency}, will convert to USD")
+            factor = get_usd_conversion_rate(reported_currency)
+            if factor is None:
+                logger.warning(
+                    f"Failed to convert {ticker_upper} balance sheet "
+                    f"from {reported_currency} to USD"
+                )
+                return None
+            usd_factor = factor
 
         for entry in annual_reports:
             fiscal_date = entry.get("fiscalDateEnding", "")
 
-            # Extract required fields, treating "None" as 0
-            def get_float(key: str) -> Optional[float]:
-                val = entry.get(key, "0")
-                if val is None or val == "None" or val == "":
-                    return 0.0
-                try:
-                    return float(val)
-                except (ValueError, TypeError):
-                    return None
-
-            total_assets = get_float("totalAssets")
-            total_liabilities = get_float("totalLiabilities")
-            total_current_assets = get_float("totalCurrentAssets")
-            goodwill = get_float("goodwill")
-            intangible_assets = get_float("intangibleAssets")
+            total_assets = _get_float(entry, "totalAssets")
+            total_liabilities = _get_float(entry, "totalLiabilities")
+            total_current_assets = _get_float(entry, "totalCurrentAssets")
+            goodwill = _get_float(entry, "goodwill")
+            intangible_assets = _get_float(entry, "intangibleAssets")
 
             # Skip if essential fields are missing
             if total_assets is None or total_liabilities is None or total_current_assets is None:
@@ -122,33 +139,12 @@ def fetch_balance_sheet(ticker: str) -> Optional[list[BalanceSheetRecord]]:
                 fiscal_year = int(fiscal_date[:4])
 
                 # Convert to USD if necessary
-                if reported_currency != "USD":
-                    total_assets_usd = convert_to_usd(total_assets, reported_currency)
-                    total_liabilities_usd = convert_to_usd(total_liabilities, reported_currency)
-                    total_current_assets_usd = convert_to_usd(
-                        total_current_assets, reported_currency
-                    )
-                    goodwill_usd = convert_to_usd(goodwill, reported_currency)
-                    intangible_assets_usd = convert_to_usd(intangible_assets, reported_currency)
-
-                    if (
-                        total_assets_usd is None
-                        or total_liabilities_usd is None
-                        or total_current_assets_usd is None
-                        or goodwill_usd is None
-                        or intangible_assets_usd is None
-                    ):
-                        logger.warning(
-                            f"Failed to convert {ticker_upper} balance sheet "
-                            f"from {reported_currency} to USD"
-                        )
-                        return None
-
-                    total_assets = total_assets_usd
-                    total_liabilities = total_liabilities_usd
-                    total_current_assets = total_current_assets_usd
-                    goodwill = goodwill_usd
-                    intangible_assets = intangible_assets_usd
+                if usd_factor != 1.0:
+                    total_assets *= usd_factor
+                    total_liabilities *= usd_factor
+                    total_current_assets *= usd_factor
+                    goodwill *= usd_factor
+                    intangible_assets *= usd_factor
 
                 records.append(
                     BalanceSheetRecord(
@@ -271,7 +267,12 @@ def get_asset_valuation(
         if new_records:
             today = date.today().isoformat()
             save_balance_sheet(conn, ticker_upper, new_records, today)
-            cached = get_cached_balance_sheet(conn, ticker_upper)
+            # We already hold the rows we just wrote; no need to read them back
+            cached = CachedBalanceSheet(
+                ticker=ticker_upper,
+                last_updated=today,
+                annual_records=new_records,
+            )
 
     # Check if we have data
     if cached is None or not cached.annual_records:
@@ -281,3 +282,59 @@ def get_asset_valuation(
     most_recent = cached.annual_records[0]
 
     return calculate_asset_valuation(most_recent, market_cap)
+
+
+def get_asset_valuation_bulk(
+    conn: sqlite3.Connection,
+    tickers: list[str],
+    market_caps: dict[str, Optional[float]],
+    latest_filing_dates: Optional[dict[str, str]] = None,
+) -> dict[str, Optional[AssetValuationResult]]:
+    """Get NTA and NCAV valuations for many tickers in one batch.
+
+    Prefetches all cached balance sheets with a single query, refreshes
+    stale tickers through the API, then computes each valuation from the
+    most recent record.
+
+    Args:
+        conn: Database connection
+        tickers: Stock ticker symbols
+        market_caps: Current market cap per uppercase ticker, as returned
+                     by get_market_caps (None where no source had a value)
+        latest_filing_dates: Latest SEC filing date per uppercase ticker
+                             (ISO format), used for cache invalidation
+
+    Returns:
+        Dict mapping uppercase ticker to AssetValuationResult, or None
+        where no data or market cap is available.
+    """
+    tickers_upper = [t.upper() for t in tickers]
+    filing_dates = {k.upper(): v for k, v in (latest_filing_dates or {}).items()}
+
+    # One SELECT for all tickers instead of N round-trips
+    cached_map = get_cached_balance_sheet_bulk(conn, tickers_upper)
+
+    results: dict[str, Optional[AssetValuationResult]] = {}
+    for ticker in tickers_upper:
+        cached = cached_map.get(ticker)
+
+        # Refresh stale or missing entries
+        filing_date = filing_dates.get(ticker)
+        if cached is None or (filing_date and filing_date > cached.last_updated):
+            new_records = fetch_balance_sheet(ticker)
+            if new_records:
+                today = date.today().isoformat()
+                save_balance_sheet(conn, ticker, new_records, today)
+                cached = CachedBalanceSheet(
+                    ticker=ticker,
+                    last_updated=today,
+                    annual_records=new_records,
+                )
+
+        market_cap = market_caps.get(ticker)
+        if cached is None or not cached.annual_records or market_cap is None:
+            results[ticker] = None
+            continue
+
+        results[ticker] = calculate_asset_valuation(cached.annual_records[0], market_cap)
+    return results
@@ -1,8 +1,12 @@
 """Telegram Bot for stock index queries with scheduled sync."""
 
+import asyncio
 import datetime
 import logging
-from functools import wraps
+import re
+import sqlite3
+import time
+from functools import lru_cache, wraps
 from typing import Callable, Coroutine, Any, Optional
 
 from telegram import BotCommand, Update
@@ -24,11 +28,12 @@ from stock_index_info.config import (
 )
 from stock_index_info.db import (
     init_db,
-    insert_constituent,
+    insert_constituents,
     delete_index_data,
     get_stock_memberships,
     get_index_constituents,
 )
+from stock_index_info.models import IndexMembership
 from stock_index_info.scrapers.sp500 import SP500Scraper
 from stock_index_info.scrapers.nasdaq100 import NASDAQ100Scraper
 from stock_index_info.sec_edgar import get_recent_filings
@@ -42,6 +47,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Process-wide database connection, opened lazily on first use. Keeping one
+# connection alive preserves SQLite's page cache across handler invocations
+# instead of rebuilding it on every command.
+_db_conn: Optional[sqlite3.Connection] = None
+
+
+def _get_db() -> sqlite3.Connection:
+    """Return the shared database connection, opening it on first use."""
+    global _db_conn
+    if _db_conn is None:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _db_conn = init_db(DB_PATH, check_same_thread=False)
+    return _db_conn
+
+
+# Cached (count, fetched_at) for /status; the count only moves when a sync runs
+_constituent_count_cache: Optional[tuple[int, float]] = None
+_CONSTITUENT_COUNT_TTL_SECONDS = 60
+
+
+def _count_constituents() -> int:
+    """Count constituent rows (blocking; run via asyncio.to_thread)."""
+    global _constituent_count_cache
+    now = time.time()
+    if (
+        _constituent_count_cache is not None
+        and now - _constituent_count_cache[1] < _CONSTITUENT_COUNT_TTL_SECONDS
+    ):
+        return _constituent_count_cache[0]
+
+    cursor = _get_db().execute("SELECT COUNT(*) FROM constituents")
+    count = int(cursor.fetchone()[0])
+    _constituent_count_cache = (count, now)
+    return count
+
+
+# Constituent data changes at most once per day (via sync), so repeated
+# queries can be served from memory until the next sync clears the caches
+@lru_cache(maxsize=256)
+def _cached_memberships(ticker: str) -> list[IndexMembership]:
+    return get_stock_memberships(_get_db(), ticker)
+
+
+@lru_cache(maxsize=8)
+def _cached_constituents(index_code: str) -> list[str]:
+    return get_index_constituents(_get_db(), index_code)
+
+
+def _clear_query_caches() -> None:
+    """Drop memoized query results; called after each sync."""
+    global _constituent_count_cache
+    _cached_memberships.cache_clear()
+    _cached_constituents.cache_clear()
+    _constituent_count_cache = None
+
 
 def restricted(
     func: Callable[[Update, ContextTypes.DEFAULT_TYPE], Coroutine[Any, Any, None]],
@@ -63,28 +123,35 @@ def restricted(
 
 async def _do_sync() -> list[str]:
     """Execute full sync - delete old data and re-fetch from Wikipedia."""
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = init_db(DB_PATH)
+    conn = _get_db()
 
     scrapers = [SP500Scraper(), NASDAQ100Scraper()]
+
+    # Fetch both indices concurrently; each fetch is independent HTTP + parsing
+    fetched = await asyncio.gather(
+        *(asyncio.to_thread(scraper.fetch) for scraper in scrapers),
+        return_exceptions=True,
+    )
+
     results: list[str] = []
+    for scraper, records in zip(scrapers, fetched):
+        if isinstance(records, BaseException):
+            results.append(f"{scraper.index_name}: Error - {records}")
+            logger.error(f"Error syncing {scraper.index_name}: {records}")
+            continue
 
-    for scraper in scrapers:
         try:
-            # Full sync: delete existing data for this index first
+            # Full sync: replace existing data for this index with the fresh fetch
             deleted = delete_index_data(conn, scraper.index_code)
             logger.info(f"Deleted {deleted} old records for {scraper.index_name}")
 
-            # Fetch and insert fresh data
-            records = scraper.fetch()
-            for record in records:
-                insert_constituent(conn, record)
+            insert_constituents(conn, records)
             results.append(f"{scraper.index_name}: {len(records)} records")
         except Exception as e:
             results.append(f"{scraper.index_name}: Error - {e}")
             logger.error(f"Error syncing {scraper.index_name}: {e}")
 
-    conn.close()
+    _clear_query_caches()
     return results
 
 
@@ -157,10 +224,7 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     db_status = "Not initialized"
     if DB_PATH.exists():
         try:
-            conn = init_db(DB_PATH)
-            cursor = conn.execute("SELECT COUNT(*) FROM constituents")
-            count = cursor.fetchone()[0]
-            conn.close()
+            count = await asyncio.to_thread(_count_constituents)
             db_status = f"{count} records"
         except Exception as e:
             db_status = f"Error: {e}"
@@ -196,21 +260,22 @@ async def ticker_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
     text = update.message.text.strip()
 
-    # Ignore messages that are clearly not ticker queries (contain spaces, numbers, etc.)
-    if " " in text or any(c.isdigit() for c in text):
-        return
-
-    ticker = text.upper()
-
-    # Valid ticker: 1-5 uppercase letters
-    if ticker.isalpha() and len(ticker) <= 5:
-        await _query_ticker(update, ticker)
-    elif ticker.isalpha() and len(ticker) > 5:
+    # Valid ticker: 1-5 letters; one precompiled match handles the check
+    # for every inbound text message
+    if _TICKER_RE.fullmatch(text):
+        await _query_ticker(update, text.upper())
+    elif text.isalpha():
         # Looks like user tried to enter a company name instead of ticker
         await update.message.reply_text(
             f"'{text}' looks like a company name, not a ticker symbol.\n"
             "Please use the stock ticker (e.g., AMZN for Amazon, AAPL for Apple)."
         )
+    # Anything else (spaces, digits, symbols) is clearly not a ticker query
+
+
+# A ticker symbol is 1-5 letters; compiled once since ticker_message runs
+# for every non-command text message the bot receives
+_TICKER_RE = re.compile(r"[A-Za-z]{1,5}")
 
 
 def _build_reuters_valuation_links(ticker: str) -> str:
@@ -229,114 +294,119 @@ def _build_reuters_valuation_links(ticker: str) -> str:
     )
 
 
+def _build_ticker_report(ticker: str) -> str:
+    """Build the full /query response text for a ticker.
+
+    Runs all blocking work (SQLite reads, SEC/yfinance/Alpha Vantage
+    requests), so callers should dispatch it via asyncio.to_thread.
+    """
+    conn = _get_db()
+    memberships = _cached_memberships(ticker)
+
+    # Build response
+    lines: list[str] = [f"*{ticker}*", ""]
+
+    # Fetch SEC filings first (needed for cache invalidation check)
+    filings = get_recent_filings(ticker)
+
+    # Get latest filing date for cache invalidation
+    latest_filing_date: Optional[str] = None
+    if filings:
+        all_dates: list[str] = [q.filing_date for q in filings.quarterly]
+        if filings.annual:
+            all_dates.append(filings.annual.filing_date)
+        if all_dates:
+            latest_filing_date = max(all_dates)
+
+    # Get market cap once for all valuation calculations
+    market_cap = get_market_cap(ticker)
+
+    # Calculate and display 7-year average P/E (at the top)
+    pe_result = get_7year_pe(
+        conn, ticker, market_cap=market_cap, latest_filing_date=latest_filing_date
+    )
+    if pe_result is not None:
+        lines.append(
+            f"P/E (7Y Avg): {pe_result.pe:.1f} | Avg Income: {format_currency(pe_result.avg_income)}"
+        )
+
+    # Calculate and display NTA/NCAV valuation
+    asset_val = None
+    if market_cap is not None:
+        asset_val = get_asset_valuation(
+            conn, ticker, market_cap=market_cap, latest_filing_date=latest_filing_date
+        )
+        if asset_val is not None:
+            # P/NTA line
+            p_nta_str = f"{asset_val.p_nta:.1f}x" if asset_val.p_nta is not None else "N/A"
+            lines.append(f"P/NTA: {p_nta_str} | NTA: {format_currency(asset_val.nta)}")
+
+            # P/NCAV line
+            p_ncav_str = f"{asset_val.p_ncav:.1f}x" if asset_val.p_ncav is not None else "N/A"
+            lines.append(f"P/NCAV: {p_ncav_str} | NCAV: {format_currency(asset_val.ncav)}")
+
+    # Add blank line after valuation metrics
+    if pe_result is not None or (market_cap is not None and asset_val is not None):
+        lines.append("")
+
+    if memberships:
+        lines.append("Index Membership:")
+        lines.append("```")
+        lines.append(f"{'Index':<12} {'Added':<12} {'Removed':<12} {'Years':>6}")
+        lines.append("-" * 44)
+
+        for m in memberships:
+            added_str = m.added_date.isoformat() if m.added_date else "?"
+            removed_str = m.removed_date.isoformat() if m.removed_date else "-"
+            years_str = f"{m.years_in_index:>6.1f}" if m.years_in_index is not None else "     ?"
+            lines.append(f"{m.index_name:<12} {added_str:<12} {removed_str:<12} {years_str}")
+
+        lines.append("```")
+    else:
+        lines.append("Not found in any tracked index.")
+
+    # Display SEC filings
+    if filings and (filings.quarterly or filings.annual):
+        lines.append("")
+        lines.append("SEC Filings:")
+
+        # Show quarterly reports (10-Q)
+        if filings.quarterly:
+            lines.append("Quarterly (10-Q):")
+            for q in filings.quarterly:
+                lines.append(f"  {q.filing_date}: {q.filing_url}")
+
+        # Show annual report (10-K)
+        if filings.annual:
+            lines.append("Annual (10-K):")
+            lines.append(f"  {filings.annual.filing_date}: {filings.annual.filing_url}")
+
+    # Reuters Valuation link
+    lines.append("")
+    lines.append(_build_reuters_valuation_links(ticker))
+
+    return "\n".join(lines)
+
+
 async def _query_ticker(update: Update, ticker: str) -> None:
     """Query and respond with ticker information."""
     if not update.message:
         return
 
-    # Ensure data directory exists
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-
     if not DB_PATH.exists():
         await update.message.reply_text(
             "Database not initialized. Please run /sync first or wait for auto-sync."
         )
         return
 
-    conn = init_db(DB_PATH)
     try:
-        memberships = get_stock_memberships(conn, ticker)
-
-        # Build response
-        lines: list[str] = [f"*{ticker}*", ""]
-
-        # Fetch SEC filings first (needed for cache invalidation check)
-        filings = get_recent_filings(ticker)
-
-        # Get latest filing date for cache invalidation
-        latest_filing_date: Optional[str] = None
-        if filings:
-            all_dates: list[str] = [q.filing_date for q in filings.quarterly]
-            if filings.annual:
-                all_dates.append(filings.annual.filing_date)
-            if all_dates:
-                latest_filing_date = max(all_dates)
-
-        # Get market cap once for all valuation calculations
-        market_cap = get_market_cap(ticker)
-
-        # Calculate and display 7-year average P/E (at the top)
-        pe_result = get_7year_pe(
-            conn, ticker, market_cap=market_cap, latest_filing_date=latest_filing_date
-        )
-        if pe_result is not None:
-            lines.append(
-                f"P/E (7Y Avg): {pe_result.pe:.1f} | Avg Income: {format_currency(pe_result.avg_income)}"
-            )
-
-        # Calculate and display NTA/NCAV valuation
-        asset_val = None
-        if market_cap is not None:
-            asset_val = get_asset_valuation(
-                conn, ticker, market_cap=market_cap, latest_filing_date=latest_filing_date
-            )
-            if asset_val is not None:
-                # P/NTA line
-                p_nta_str = f"{asset_val.p_nta:.1f}x" if asset_val.p_nta is not None else "N/A"
-                lines.append(f"P/NTA: {p_nta_str} | NTA: {format_currency(asset_val.nta)}")
-
-                # P/NCAV line
-                p_ncav_str = f"{asset_val.p_ncav:.1f}x" if asset_val.p_ncav is not None else "N/A"
-                lines.append(f"P/NCAV: {p_ncav_str} | NCAV: {format_currency(asset_val.ncav)}")
-
-        # Add blank line after valuation metrics
-        if pe_result is not None or (market_cap is not None and asset_val is not None):
-            lines.append("")
-
-        if memberships:
-            lines.append("Index Membership:")
-            lines.append("```")
-            lines.append(f"{'Index':<12} {'Added':<12} {'Removed':<12} {'Years':>6}")
-            lines.append("-" * 44)
-
-            for m in memberships:
-                added_str = m.added_date.isoformat() if m.added_date else "?"
-                removed_str = m.removed_date.isoformat() if m.removed_date else "-"
-                years_str = (
-                    f"{m.years_in_index:>6.1f}" if m.years_in_index is not None else "     ?"
-                )
-                lines.append(f"{m.index_name:<12} {added_str:<12} {removed_str:<12} {years_str}")
-
-            lines.append("```")
-        else:
-            lines.append("Not found in any tracked index.")
-
-        # Display SEC filings
-        if filings and (filings.quarterly or filings.annual):
-            lines.append("")
-            lines.append("SEC Filings:")
-
-            # Show quarterly reports (10-Q)
-            if filings.quarterly:
-                lines.append("Quarterly (10-Q):")
-                for q in filings.quarterly:
-                    lines.append(f"  {q.filing_date}: {q.filing_url}")
-
-            # Show annual report (10-K)
-            if filings.annual:
-                lines.append("Annual (10-K):")
-                lines.append(f"  {filings.annual.filing_date}: {filings.annual.filing_url}")
-
-        # Reuters Valuation link
-        lines.append("")
-        lines.append(_build_reuters_valuation_links(ticker))
-
-        await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
+        # The report builder does SQLite and HTTP work; keep it off the
+        # event loop so other handlers stay responsive
+        text = await asyncio.to_thread(_build_ticker_report, ticker)
+        await update.message.reply_text(text, parse_mode="Markdown")
     except Exception as e:
         logger.error(f"Error querying ticker {ticker}: {e}")
         await update.message.reply_text(f"Error querying {ticker}. Please try again.")
-    finally:
-        conn.close()
 
 
 @restricted
@@ -358,29 +428,23 @@ async def constituents_command(update: Update, context: ContextTypes.DEFAULT_TYP
         await update.message.reply_text("Invalid index. Available indices: sp500, nasdaq100")
         return
 
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-
     if not DB_PATH.exists():
         await update.message.reply_text(
             "Database not initialized. Please run /sync first or wait for auto-sync."
         )
         return
 
-    conn = init_db(DB_PATH)
-    try:
-        tickers = get_index_constituents(conn, index_code)
+    tickers = await asyncio.to_thread(_cached_constituents, index_code)
 
-        if not tickers:
-            await update.message.reply_text(f"No constituents found for {index_code}")
-            return
+    if not tickers:
+        await update.message.reply_text(f"No constituents found for {index_code}")
+        return
 
-        index_name = "S&P 500" if index_code == "sp500" else "NASDAQ 100"
-        await update.message.reply_text(
-            f"*{index_name}* constituents ({len(tickers)}):\n\n{', '.join(tickers)}",
-            parse_mode="Markdown",
-        )
-    finally:
-        conn.close()
+    index_name = "S&P 500" if index_code == "sp500" else "NASDAQ 100"
+    await update.message.reply_text(
+        f"*{index_name}* constituents ({len(tickers)}):\n\n{', '.join(tickers)}",
+        parse_mode="Markdown",
+    )
 
 
 @restricted
@@ -422,7 +486,12 @@ def main() -> None:
     logger.info(f"Starting bot with {len(ALLOWED_USER_IDS)} allowed users")
     logger.info(f"Scheduled sync at {SYNC_HOUR:02d}:{SYNC_MINUTE:02d} daily")
 
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    # Create the data directory once at startup instead of per handler
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+    # concurrent_updates lets independent commands from different users run
+    # in parallel instead of strictly one update at a time
+    application = Application.builder().token(TELEGRAM_BOT_TOKEN).concurrent_updates(True).build()
 
     # Register command handlers
     application.add_handler(CommandHandler("start", start_command))
@@ -3,7 +3,7 @@
 import sqlite3
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from stock_index_info.models import (
     ConstituentRecord,
@@ -57,9 +57,57 @@ CREATE INDEX IF NOT EXISTS idx_balance_sheets_ticker ON balance_sheets(ticker);
 """
 
 
-def init_db(db_path: Path) -> sqlite3.Connection:
+# Maximum entries held in a connection's in-memory income memo
+_INCOME_MEMO_MAX = 1024
+
+
+class Connection(sqlite3.Connection):
+    """sqlite3.Connection with an in-memory memo for cached income lookups.
+
+    Repeat get_cached_income calls on the same connection skip the SQL
+    round-trip and dataclass rebuild. Writes through save_income /
+    save_income_bulk invalidate the affected tickers.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.income_memo: dict[str, Optional[CachedIncome]] = {}
+
+
+def _memo_put(conn: sqlite3.Connection, ticker_upper: str, value: Optional[CachedIncome]) -> None:
+    """Store a lookup result in the connection's income memo, if it has one."""
+    if not isinstance(conn, Connection):
+        return
+    memo = conn.income_memo
+    if len(memo) >= _INCOME_MEMO_MAX:
+        # Evict the oldest insertion to bound memory
+        memo.pop(next(iter(memo)))
+    memo[ticker_upper] = value
+
+
+def _memo_invalidate(conn: sqlite3.Connection, tickers_upper: list[str]) -> None:
+    """Drop tickers from the connection's income memo after a write."""
+    if not isinstance(conn, Connection):
+        return
+    memo = conn.income_memo
+    for ticker in tickers_upper:
+        memo.pop(ticker, None)
+
+
+def init_db(db_path: Path, check_same_thread: bool = True) -> sqlite3.Connection:
     """Initialize database with schema and return connection."""
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, factory=Connection, check_same_thread=check_same_thread)
+    # WAL lets readers proceed during writes and makes commits cheaper;
+    # NORMAL sync is durable enough under WAL and halves the fsync count,
+    # and a bigger page cache (64 MB) keeps the hot tables resident
+    conn.executescript(
+        """
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-65536;
+        """
+    )
     conn.executescript(SCHEMA)
     conn.commit()
     return conn
@@ -83,6 +131,27 @@ def insert_constituent(conn: sqlite3.Connection, record: ConstituentRecord) -> N
     conn.commit()
 
 
+def insert_constituents(conn: sqlite3.Connection, records: list[ConstituentRecord]) -> None:
+    """Insert constituent records in one transaction, ignoring duplicates."""
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO constituents (ticker, index_code, added_date, removed_date, reason)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        (
+            (
+                record.ticker,
+                record.index_code,
+                record.added_date.isoformat() if record.added_date else None,
+                record.removed_date.isoformat() if record.removed_date else None,
+                record.reason,
+            )
+            for record in records
+        ),
+    )
+    conn.commit()
+
+
 def delete_index_data(conn: sqlite3.Connection, index_code: str) -> int:
     """Delete all data for an index. Returns number of rows deleted."""
     cursor = conn.execute(
@@ -157,25 +226,27 @@ def save_income(
     """Save income statement records for a ticker, replacing any existing data."""
     ticker_upper = ticker.upper()
 
-    # Delete existing data for this ticker
+    # Delete existing data for this ticker, then insert replacements in one batch
     conn.execute("DELETE FROM income_statements WHERE ticker = ?", (ticker_upper,))
-
-    # Insert new records
-    for record in records:
-        conn.execute(
-            """
-            INSERT INTO income_statements (ticker, fiscal_year, net_income, last_updated)
-            VALUES (?, ?, ?, ?)
-            """,
-            (ticker_upper, record.fiscal_year, record.net_income, last_updated),
-        )
+    conn.executemany(
+        """
+        INSERT INTO income_statements (ticker, fiscal_year, net_income, last_updated)
+        VALUES (?, ?, ?, ?)
+        """,
+        [(ticker_upper, record.fiscal_year, record.net_income, last_updated) for record in records],
+    )
     conn.commit()
+    _memo_invalidate(conn, [ticker_upper])
 
 
 def get_cached_income(conn: sqlite3.Connection, ticker: str) -> Optional[CachedIncome]:
     """Get cached income statements for a ticker, or None if not cached."""
     ticker_upper = ticker.upper()
 
+    memo = conn.income_memo if isinstance(conn, Connection) else None
+    if memo is not None and ticker_upper in memo:
+        return memo[ticker_upper]
+
     cursor = conn.execute(
         """
         SELECT fiscal_year, net_income, last_updated
@@ -188,17 +259,102 @@ def get_cached_income(conn: sqlite3.Connection, ticker: str) -> Optional[CachedI
 
     rows = cursor.fetchall()
     if not rows:
+        _memo_put(conn, ticker_upper, None)
         return None
 
     records = [
         IncomeRecord(ticker=ticker_upper, fiscal_year=row[0], net_income=row[1]) for row in rows
     ]
 
-    return CachedIncome(
+    cached = CachedIncome(
         ticker=ticker_upper,
         last_updated=rows[0][2],  # All rows have same last_updated
         annual_income=records,
     )
+    _memo_put(conn, ticker_upper, cached)
+    return cached
+
+
+def get_cached_income_bulk(
+    conn: sqlite3.Connection,
+    tickers: list[str],
+) -> dict[str, CachedIncome]:
+    """Get cached income statements for many tickers with a single query.
+
+    Avoids the per-ticker SELECT round-trip when a batch caller needs the
+    cache state for hundreds of tickers at once.
+
+    Args:
+        conn: Database connection
+        tickers: Stock ticker symbols
+
+    Returns:
+        Dict mapping uppercase ticker to CachedIncome; tickers with no
+        cached rows are absent from the dict.
+    """
+    if not tickers:
+        return {}
+
+    tickers_upper = [t.upper() for t in tickers]
+    placeholders = ",".join("?" * len(tickers_upper))
+
+    cursor = conn.execute(
+        f"""
+        SELECT ticker, fiscal_year, net_income, last_updated
+        FROM income_statements
+        WHERE ticker IN ({placeholders})
+        ORDER BY ticker, fiscal_year DESC
+        """,
+        tickers_upper,
+    )
+
+    cached: dict[str, CachedIncome] = {}
+    for row in cursor.fetchall():
+        ticker = row[0]
+        entry = cached.get(ticker)
+        if entry is None:
+            # All rows for a ticker have the same last_updated
+            entry = CachedIncome(ticker=ticker, last_updated=row[3], annual_income=[])
+            cached[ticker] = entry
+        entry.annual_income.append(
+            IncomeRecord(ticker=ticker, fiscal_year=row[1], net_income=row[2])
+        )
+    return cached
+
+
+def save_income_bulk(
+    conn: sqlite3.Connection,
+    records_by_ticker: dict[str, list[IncomeRecord]],
+    last_updated: str,
+) -> None:
+    """Save income records for many tickers in a single transaction.
+
+    Replaces any existing data for the given tickers, using executemany so
+    the batch costs one commit instead of one per ticker.
+    """
+    if not records_by_ticker:
+        return
+
+    tickers_upper = [t.upper() for t in records_by_ticker]
+    placeholders = ",".join("?" * len(tickers_upper))
+
+    conn.execute(
+        f"DELETE FROM income_statements WHERE ticker IN ({placeholders})",
+        tickers_upper,
+    )
+    conn.executemany(
+        """
+        INSERT INTO income_statements (ticker, fiscal_year, net_income, last_updated)
+        VALUES (?, ?, ?, ?)
+        """,
+        [
+            (ticker.upper(), record.fiscal_year, record.net_income, last_updated)
+            for ticker, records in records_by_ticker.items()
+            for record in records
+        ],
+    )
+    conn.commit()
+    _memo_invalidate(conn, tickers_upper)
 
 
 def save_balance_sheet(
@@ -210,19 +366,17 @@ def save_balance_sheet(
     """Save balance sheet records for a ticker, replacing any existing data."""
     ticker_upper = ticker.upper()
 
-    # Delete existing data for this ticker
+    # Delete existing data for this ticker, then insert replacements in one batch
     conn.execute("DELETE FROM balance_sheets WHERE ticker = ?", (ticker_upper,))
-
-    # Insert new records
-    for record in records:
-        conn.execute(
-            """
-            INSERT INTO balance_sheets (
-                ticker, fiscal_year, total_assets, total_liabilities,
-                total_current_assets, goodwill, intangible_assets, last_updated
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+    conn.executemany(
+        """
+        INSERT INTO balance_sheets (
+            ticker, fiscal_year, total_assets, total_liabilities,
+            total_current_assets, goodwill, intangible_assets, last_updated
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
             (
                 ticker_upper,
                 record.fiscal_year,
@@ -232,8 +386,10 @@ def save_balance_sheet(
                 record.goodwill,
                 record.intangible_assets,
                 last_updated,
-            ),
-        )
+            )
+            for record in records
+        ],
+    )
     conn.commit()
 
 
@@ -274,3 +430,56 @@ def get_cached_balance_sheet(conn: sqlite3.Connection, ticker: str) -> Optional[
         last_updated=rows[0][6],  # All rows have same last_updated
         annual_records=records,
     )
+
+
+def get_cached_balance_sheet_bulk(
+    conn: sqlite3.Connection,
+    tickers: list[str],
+) -> dict[str, CachedBalanceSheet]:
+    """Get cached balance sheets for many tickers with a single query.
+
+    Args:
+        conn: Database connection
+        tickers: Stock ticker symbols
+
+    Returns:
+        Dict mapping uppercase ticker to CachedBalanceSheet; tickers with
+        no cached rows are absent from the dict.
+    """
+    if not tickers:
+        return {}
+
+    tickers_upper = [t.upper() for t in tickers]
+    placeholders = ",".join("?" * len(tickers_upper))
+
+    cursor = conn.execute(
+        f"""
+        SELECT ticker, fiscal_year, total_assets, total_liabilities, total_current_assets,
+               goodwill, intangible_assets, last_updated
+        FROM balance_sheets
+        WHERE ticker IN ({placeholders})
+        ORDER BY ticker, fiscal_year DESC
+        """,
+        tickers_upper,
+    )
+
+    cached: dict[str, CachedBalanceSheet] = {}
+    for row in cursor.fetchall():
+        ticker = row[0]
+        entry = cached.get(ticker)
+        if entry is None:
+            # All rows for a ticker have the same last_updated
+            entry = CachedBalanceSheet(ticker=ticker, last_updated=row[7], annual_records=[])
+            cached[ticker] = entry
+        entry.annual_records.append(
+            BalanceSheetRecord(
+                ticker=ticker,
+                fiscal_year=row[1],
+                total_assets=row[2],
+                total_liabilities=row[3],
+                total_current_assets=row[4],
+                goodwill=row[5],
+                intangible_assets=row[6],
+            )
+        )
+    return cached
@@ -1,17 +1,30 @@
 """Exchange rate utilities for currency conversion."""
 
+import json
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from typing import Optional
 
 from curl_cffi import requests
 
+from stock_index_info.config import DATA_DIR
+from stock_index_info.http_client import get_session
+
 logger = logging.getLogger(__name__)
 
 # Cache expiration time in seconds (24 hours)
 _CACHE_EXPIRATION_SECONDS = 24 * 60 * 60
 
+# When a refresh fails, keep serving the stale rates and retry this much later
+# instead of hammering the API (and returning None) on every call
+_STALE_RETRY_SECONDS = 60 * 60
+
+# On-disk copy of the last fetched rates, so restarts within the cache
+# window skip the API call entirely
+_CACHE_FILE_PATH = DATA_DIR / "exchange_rates.json"
+
 # Track last API call time for logging
 _last_api_call_time: float = 0.0
 
@@ -22,11 +35,62 @@ class _ExchangeRateCache:
 
     rates: dict[str, float]
     timestamp: float  # Unix timestamp when cache was created
+    # Validators from the last response, for conditional refreshes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 # Cache exchange rates to avoid repeated API calls
 _exchange_rates_cache: Optional[_ExchangeRateCache] = None
 
+# Single-flight lock: concurrent cache misses wait for one fetch instead of
+# each firing their own HTTP request
+_fetch_lock = threading.Lock()
+
+
+def _load_cache_from_disk() -> Optional[_ExchangeRateCache]:
+    """Load previously persisted rates, or None if missing/stale/corrupt."""
+    try:
+        with open(_CACHE_FILE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+        timestamp = float(data["timestamp"])
+        rates = {str(code): float(rate) for code, rate in data["rates"].items()}
+        etag = data.get("etag")
+        last_modified = data.get("last_modified")
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(
+            f"[API] get_exchange_rates(): ignoring unreadable cache file - {type(e).__name__}: {e}"
+        )
+        return None
+
+    if not rates or time.time() - timestamp >= _CACHE_EXPIRATION_SECONDS:
+        return None
+    return _ExchangeRateCache(
+        rates=rates, timestamp=timestamp, etag=etag, last_modified=last_modified
+    )
+
+
+def _save_cache_to_disk(cache: _ExchangeRateCache) -> None:
+    """Persist rates so a restart within the cache window skips the API."""
+    try:
+        _CACHE_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_CACHE_FILE_PATH, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "timestamp": cache.timestamp,
+                    "rates": cache.rates,
+                    "etag": cache.etag,
+                    "last_modified": cache.last_modified,
+                },
+                f,
+            )
+    except Exception as e:
+        logger.warning(
+            f"[API] get_exchange_rates(): failed to persist cache - {type(e).__name__}: {e}"
+        )
+
 
 def get_exchange_rates() -> Optional[dict[str, float]]:
     """Fetch current exchange rates from USD to other currencies.
@@ -35,24 +99,80 @@ def get_exchange_rates() -> Optional[dict[str, float]]:
         Dict mapping currency code to rate (1 USD = X currency),
         or None if API call fails.
     """
-    global _exchange_rates_cache, _last_api_call_time
+    global _exchange_rates_cache
+
+    # A fresh process can reuse rates persisted by a previous run
+    if _exchange_rates_cache is None:
+        _exchange_rates_cache = _load_cache_from_disk()
+        if _exchange_rates_cache is not None:
+            logger.info("[API] get_exchange_rates(): loaded cached rates from disk")
 
     # Check if cache exists and is not expired
     if _exchange_rates_cache is not None:
         age = time.time() - _exchange_rates_cache.timestamp
         if age < _CACHE_EXPIRATION_SECONDS:
-            logger.debug(f"[API] get_exchange_rates(): using cached rates (age: {age:.0f}s)")
+            # %-style so the message is only formatted when DEBUG is on
+            logger.debug("[API] get_exchange_rates(): using cached rates (age: %.0fs)", age)
             return _exchange_rates_cache.rates
         else:
             logger.info(f"[API] get_exchange_rates(): cache expired (age: {age:.0f}s), refreshing")
 
+    with _fetch_lock:
+        # Another thread may have refreshed while we waited for the lock
+        if _exchange_rates_cache is not None:
+            age = time.time() - _exchange_rates_cache.timestamp
+            if age < _CACHE_EXPIRATION_SECONDS:
+                return _exchange_rates_cache.rates
+
+        rates = _fetch_fresh()
+        if rates is not None:
+            return rates
+
+        # Refresh failed: serve the stale rates rather than failing every
+        # conversion, and back off before the next refresh attempt
+        if _exchange_rates_cache is not None:
+            _exchange_rates_cache.timestamp = (
+                time.time() - _CACHE_EXPIRATION_SECONDS + _STALE_RETRY_SECONDS
+            )
+            logger.warning(
+                "[API] get_exchange_rates(): refresh failed, serving stale rates "
+                f"(retry in {_STALE_RETRY_SECONDS}s)"
+            )
+            return _exchange_rates_cache.rates
+
+        return None
+
+
+def _fetch_fresh() -> Optional[dict[str, float]]:
+    """Fetch rates from the API, updating the caches on success."""
+    global _exchange_rates_cache
+
     url = "https://open.er-api.com/v6/latest/USD"
     logger.info(f"[API] get_exchange_rates(): requesting {url}")
     start_time = time.time()
 
+    # Revalidate against the stale cache's validators so an unchanged
+    # payload comes back as a bodyless 304
+    headers: dict[str, str] = {}
+    if _exchange_rates_cache is not None:
+        if _exchange_rates_cache.etag:
+            headers["If-None-Match"] = _exchange_rates_cache.etag
+        if _exchange_rates_cache.last_modified:
+            headers["If-Modified-Since"] = _exchange_rates_cache.last_modified
+
     try:
-        response = requests.get(url, timeout=30)
+        response = get_session().get(url, headers=headers or None, timeout=30)
         elapsed_ms = (time.time() - start_time) * 1000
+
+        if response.status_code == 304 and _exchange_rates_cache is not None:
+            # Upstream unchanged: keep the rates, just restart the TTL
+            _exchange_rates_cache.timestamp = time.time()
+            _save_cache_to_disk(_exchange_rates_cache)
+            logger.info(
+                f"[API] get_exchange_rates(): rates unchanged (304), elapsed={elapsed_ms:.0f}ms"
+            )
+            return _exchange_rates_cache.rates
+
         response.raise_for_status()
         data = response.json()
 
@@ -71,7 +191,13 @@ def get_exchange_rates() -> Optional[dict[str, float]]:
             return None
 
         rates: dict[str, float] = dict(rates_data)
-        _exchange_rates_cache = _ExchangeRateCache(rates=rates, timestamp=time.time())
+        _exchange_rates_cache = _ExchangeRateCache(
+            rates=rates,
+            timestamp=time.time(),
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        _save_cache_to_disk(_exchange_rates_cache)
         logger.info(
             f"[API] get_exchange_rates(): successfully fetched rates for {len(rates)} currencies"
         )
@@ -94,39 +220,71 @@ def get_exchange_rates() -> Optional[dict[str, float]]:
         return None
 
 
-def convert_to_usd(amount: float, from_currency: str) -> Optional[float]:
-    """Convert an amount from a foreign currency to USD.
+def get_usd_conversion_rate(from_currency: str) -> Optional[float]:
+    """Get the multiplier that converts amounts in from_currency to USD.
+
+    Fetching the factor once lets callers convert many values with plain
+    multiplications instead of a rate lookup per value.
 
     Args:
-        amount: The amount in the source currency
         from_currency: The source currency code (e.g., "DKK", "EUR")
 
     Returns:
-        The amount in USD, or None if conversion fails.
+        Factor such that usd_amount = amount * factor, or None if the
+        rate is unavailable. USD returns 1.0 without touching the rates.
     """
     if from_currency == "USD":
-        return amount
-
-    logger.debug(f"[API] convert_to_usd(): converting {amount} {from_currency} to USD")
+        return 1.0
 
     rates = get_exchange_rates()
     if rates is None:
-        logger.warning(f"[API] convert_to_usd(): failed to get exchange rates for {from_currency}")
+        logger.warning(
+            f"[API] get_usd_conversion_rate(): failed to get exchange rates for {from_currency}"
+        )
         return None
 
     rate = rates.get(from_currency)
     if rate is None:
-        logger.warning(f"[API] convert_to_usd(): no exchange rate found for {from_currency}")
+        logger.warning(
+            f"[API] get_usd_conversion_rate(): no exchange rate found for {from_currency}"
+        )
         return None
 
     if rate <= 0:
-        logger.warning(f"[API] convert_to_usd(): invalid exchange rate for {from_currency}: {rate}")
+        logger.warning(
+            f"[API] get_usd_conversion_rate(): invalid exchange rate for {from_currency}: {rate}"
+        )
+        return None
+
+    # rates are "1 USD = X currency", so the USD factor is the reciprocal
+    return 1.0 / rate
+
+
+def convert_to_usd(amount: float, from_currency: str) -> Optional[float]:
+    """Convert an amount from a foreign currency to USD.
+
+    Args:
+        amount: The amount in the source currency
+        from_currency: The source currency code (e.g., "DKK", "EUR")
+
+    Returns:
+        The amount in USD, or None if conversion fails.
+    """
+    if from_currency == "USD":
+        return amount
+
+    factor = get_usd_conversion_rate(from_currency)
+    if factor is None:
         return None
 
-    # rates are "1 USD = X currency", so we divide to get USD
-    usd_amount = amount / rate
+    usd_amount = amount * factor
+    # %-style so the message is only formatted when DEBUG is on
     logger.debug(
-        f"[API] convert_to_usd(): {amount} {from_currency} = {usd_amount} USD (rate: {rate})"
+        "[API] convert_to_usd(): %s %s = %s USD (factor: %s)",
+        amount,
+        from_currency,
+        usd_amount,
+        factor,
     )
     return usd_amount
 
@@ -0,0 +1,20 @@
+"""Shared HTTP session for outbound requests.
+
+Keeping one process-wide session lets repeat requests to the same host
+(Wikipedia, the exchange-rate API) reuse the pooled TCP + TLS connection
+instead of paying a fresh handshake per call.
+"""
+
+from typing import Optional
+
+from curl_cffi import requests
+
+_session: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        _session = requests.Session(impersonate="chrome")
+    return _session
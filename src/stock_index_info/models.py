@@ -11,7 +11,7 @@ INDEX_NAMES: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstituentRecord:
     """A record of stock membership in an index."""
 
@@ -23,7 +23,7 @@ class ConstituentRecord:
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IndexMembership:
     """Represents a stock's membership in an index with computed properties."""
 
@@ -51,7 +51,7 @@ class IndexMembership:
         return delta.days / 365.25
 
 
-@dataclass
+@dataclass(slots=True)
 class SECFilingRecord:
     """A record of SEC filing for a stock."""
 
@@ -61,7 +61,7 @@ class SECFilingRecord:
     filing_url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RecentFilings:
     """Recent SEC filings for a stock."""
 
@@ -69,7 +69,7 @@ class RecentFilings:
     annual: Optional[SECFilingRecord]  # Latest 10-K filing, or None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IncomeRecord:
     """Annual net income record for a stock."""
 
@@ -78,7 +78,7 @@ class IncomeRecord:
     net_income: float  # Net income in dollars (not millions)
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedIncome:
     """Cached income statement data for a stock."""
 
@@ -87,7 +87,7 @@ class CachedIncome:
     annual_income: list[IncomeRecord]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BalanceSheetRecord:
     """Annual balance sheet record for a stock."""
 
@@ -100,7 +100,7 @@ class BalanceSheetRecord:
     intangible_assets: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedBalanceSheet:
     """Cached balance sheet data for a stock."""
 
@@ -109,7 +109,7 @@ class CachedBalanceSheet:
     annual_records: list["BalanceSheetRecord"]
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetValuationResult:
     """NTA and NCAV calculation result."""
 
@@ -119,7 +119,7 @@ class AssetValuationResult:
     p_ncav: Optional[float]  # P/NCAV ratio, None if NCAV <= 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PEResult:
     """7-year average P/E calculation result."""
 
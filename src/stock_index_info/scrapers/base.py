@@ -1,9 +1,17 @@
 """Abstract base class for index scrapers."""
 
+import json
+import logging
 from abc import ABC, abstractmethod
+from datetime import date
+from pathlib import Path
+from typing import Optional
 
+from stock_index_info.config import DATA_DIR
 from stock_index_info.models import ConstituentRecord
 
+logger = logging.getLogger(__name__)
+
 
 class BaseScraper(ABC):
     """Base class for index data scrapers."""
@@ -24,3 +32,76 @@ class BaseScraper(ABC):
     def fetch(self) -> list[ConstituentRecord]:
         """Fetch and parse constituent data from source."""
         ...
+
+    @property
+    def _scrape_cache_path(self) -> Path:
+        """On-disk copy of the last scrape, keyed by index code."""
+        return DATA_DIR / f"scrape_{self.index_code}.json"
+
+    def _load_scrape_cache(
+        self,
+    ) -> Optional[tuple[Optional[str], Optional[str], list[ConstituentRecord]]]:
+        """Load the last scrape's validators and records from disk.
+
+        Returns:
+            Tuple of (etag, last_modified, records), or None if the cache
+            file is missing or unreadable.
+        """
+        try:
+            with open(self._scrape_cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+            records = [
+                ConstituentRecord(
+                    ticker=r["ticker"],
+                    index_code=r["index_code"],
+                    added_date=date.fromisoformat(r["added_date"]) if r["added_date"] else None,
+                    removed_date=(
+                        date.fromisoformat(r["removed_date"]) if r["removed_date"] else None
+                    ),
+                    company_name=r.get("company_name"),
+                    reason=r.get("reason"),
+                )
+                for r in data["records"]
+            ]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(
+                f"[SCRAPER] {self.index_code}: ignoring unreadable scrape cache - "
+                f"{type(e).__name__}: {e}"
+            )
+            return None
+        return data.get("etag"), data.get("last_modified"), records
+
+    def _save_scrape_cache(
+        self,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        records: list[ConstituentRecord],
+    ) -> None:
+        """Persist the scrape result with its validators for revalidation."""
+        try:
+            payload = json.dumps(
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "records": [
+                        {
+                            "ticker": r.ticker,
+                            "index_code": r.index_code,
+                            "added_date": r.added_date.isoformat() if r.added_date else None,
+                            "removed_date": r.removed_date.isoformat() if r.removed_date else None,
+                            "company_name": r.company_name,
+                            "reason": r.reason,
+                        }
+                        for r in records
+                    ],
+                }
+            )
+            self._scrape_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._scrape_cache_path.write_text(payload, encoding="utf-8")
+        except Exception as e:
+            logger.warning(
+                f"[SCRAPER] {self.index_code}: failed to persist scrape cache - "
+                f"{type(e).__name__}: {e}"
+            )
@@ -1,16 +1,30 @@
 """NASDAQ 100 Wikipedia scraper."""
 
 from datetime import datetime, date
+from functools import lru_cache
 from io import StringIO
 from typing import Optional
 
 import pandas as pd
 from bs4 import BeautifulSoup, Tag
-from curl_cffi import requests
+from bs4.filter import SoupStrainer
 
+from stock_index_info.http_client import get_session
 from stock_index_info.models import ConstituentRecord
 from stock_index_info.scrapers.base import BaseScraper
 
+# Textual date formats used by Wikipedia change tables; ISO dates take a
+# separate fast path through date.fromisoformat
+_DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y")
+
+# Translation table for normalizing column names (spaces to underscores)
+_COL_TRANS = str.maketrans(" ", "_")
+
+# Build the soup from the wikitables only, skipping the rest of the page
+# (nav, infoboxes, references). The class attribute is still a raw string
+# while parsing, so match it with a callable instead of class_="wikitable"
+_WIKITABLE_STRAINER = SoupStrainer("table", class_=lambda c: bool(c) and "wikitable" in c.split())
+
 
 class NASDAQ100Scraper(BaseScraper):
     """Scrapes NASDAQ 100 constituent data from Wikipedia."""
@@ -27,35 +41,57 @@ class NASDAQ100Scraper(BaseScraper):
 
     def fetch(self) -> list[ConstituentRecord]:
         """Fetch current constituents and historical changes."""
-        response = requests.get(self.WIKI_URL, impersonate="chrome", timeout=30.0)
+        # Revalidate against the last scrape's validators so an unchanged
+        # page comes back as a bodyless 304 and skips all parsing
+        cached = self._load_scrape_cache()
+        headers: dict[str, str] = {}
+        if cached is not None:
+            cached_etag, cached_last_modified, _ = cached
+            if cached_etag:
+                headers["If-None-Match"] = cached_etag
+            if cached_last_modified:
+                headers["If-Modified-Since"] = cached_last_modified
+
+        response = get_session().get(self.WIKI_URL, headers=headers or None, timeout=30.0)
+        if response.status_code == 304 and cached is not None:
+            return cached[2]
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        # lxml (libxml2) parses the ~500 KB page far faster than html.parser
+        soup = BeautifulSoup(response.text, "lxml", parse_only=_WIKITABLE_STRAINER)
         tables = soup.find_all("table", class_="wikitable")
 
-        # First pass: parse changes table to collect all add/remove events
+        # Classify each wikitable once by its header row instead of running
+        # the expensive parsers over every table per pass
+        changes_table: Optional[Tag] = None
+        current_table: Optional[Tag] = None
+        for table in tables:
+            if changes_table is not None and current_table is not None:
+                break
+            first_row = table.find("tr")
+            if first_row is None:
+                continue
+            header_texts = {th.get_text(strip=True).lower() for th in first_row.find_all("th")}
+            if changes_table is None and ("added" in header_texts or "removed" in header_texts):
+                changes_table = table
+            elif current_table is None and "ticker" in header_texts:
+                current_table = table
+
+        # Parse changes first: the current table needs its added dates.
         # Each row is a time-point event, not a stock lifecycle
         added_dates: dict[str, date] = {}  # ticker -> added_date
         removed_dates: dict[str, date] = {}  # ticker -> removed_date
+        if changes_table is not None:
+            added_dates, removed_dates = self._parse_changes_table(changes_table)
 
-        for table in tables:
-            added, removed = self._parse_changes_table(table)
-            if added or removed:
-                added_dates.update(added)
-                removed_dates.update(removed)
-                break
-
-        # Second pass: parse current constituents
+        # Parse current constituents
         records: list[ConstituentRecord] = []
         current_tickers: set[str] = set()
-
-        for table in tables:
-            current = self._parse_current_table(table, added_dates)
-            if current:
-                for r in current:
-                    current_tickers.add(r.ticker)
-                records.extend(current)
-                break
+        if current_table is not None:
+            current = self._parse_current_table(current_table, added_dates)
+            for r in current:
+                current_tickers.add(r.ticker)
+            records.extend(current)
 
         # Add removed stocks (not in current constituents)
         # Merge their added_date from the changes table
@@ -70,27 +106,49 @@ class NASDAQ100Scraper(BaseScraper):
                     )
                 )
 
+        # Persist the result only when the response carries validators;
+        # without them the next request can't revalidate anyway
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if isinstance(etag, str) or isinstance(last_modified, str):
+            self._save_scrape_cache(etag, last_modified, records)
+
         return records
 
     def _parse_current_table(
         self, table: Tag, added_dates: dict[str, date]
     ) -> list[ConstituentRecord]:
-        """Try to parse as current constituents table."""
+        """Try to parse as current constituents table.
+
+        Walks the rows directly with BeautifulSoup; the simple single-header
+        layout doesn't need a pandas re-parse of the serialized table.
+        """
         records: list[ConstituentRecord] = []
 
         try:
-            df = pd.read_html(StringIO(str(table)))[0]
-            df.columns = [str(c).lower() for c in df.columns]
+            rows = table.find_all("tr")
+            if not rows:
+                return []
 
-            if "ticker" not in df.columns:
+            headers = [th.get_text(strip=True).lower() for th in rows[0].find_all("th")]
+            if "ticker" not in headers:
                 return []
 
-            for _, row in df.iterrows():
-                ticker = str(row.get("ticker", "")).strip()
-                if not ticker or ticker == "nan":
+            ticker_idx = headers.index("ticker")
+            company_idx = headers.index("company") if "company" in headers else None
+
+            for row in rows[1:]:
+                cells = row.find_all(["td", "th"])
+                if len(cells) <= ticker_idx:
+                    continue
+
+                ticker = cells[ticker_idx].get_text(strip=True)
+                if not ticker:
                     continue
 
-                company = str(row.get("company", ""))
+                company = ""
+                if company_idx is not None and len(cells) > company_idx:
+                    company = cells[company_idx].get_text(strip=True)
 
                 # Use real added date from changes table, None if not found
                 added_date = added_dates.get(ticker)
@@ -101,7 +159,7 @@ class NASDAQ100Scraper(BaseScraper):
                         index_code=self.index_code,
                         added_date=added_date,
                         removed_date=None,
-                        company_name=company if company != "nan" else None,
+                        company_name=company or None,
                     )
                 )
         except Exception:
@@ -122,32 +180,45 @@ class NASDAQ100Scraper(BaseScraper):
         removed_dates: dict[str, date] = {}
 
         try:
-            df = pd.read_html(StringIO(str(table)))[0]
+            df = pd.read_html(StringIO(str(table)), flavor="lxml")[0]
 
             # Flatten multi-level columns
             if isinstance(df.columns, pd.MultiIndex):
                 df.columns = ["_".join(map(str, col)).strip() for col in df.columns]
 
             # Normalize column names
-            df.columns = [str(c).lower().replace(" ", "_") for c in df.columns]
+            df.columns = [str(c).lower().translate(_COL_TRANS) for c in df.columns]
+
+            # Resolve the relevant columns once instead of scanning every
+            # column name again for every row
+            date_col = next((c for c in df.columns if "date" in c), None)
+            added_col = next((c for c in df.columns if "added" in c and "ticker" in c), None)
+            removed_col = next((c for c in df.columns if "removed" in c and "ticker" in c), None)
 
             # Check if this looks like a changes table
-            cols_str = " ".join(str(c).lower() for c in df.columns)
-            if "added" not in cols_str and "removed" not in cols_str:
+            if date_col is None or (added_col is None and removed_col is None):
                 return {}, {}
 
-            for _, row in df.iterrows():
-                effective_date = self._find_date(row)
+            # Zip plain column lists instead of iterrows(), which boxes
+            # every row into a Series
+            date_values = df[date_col].tolist()
+            added_values = df[added_col].tolist() if added_col else [None] * len(df)
+            removed_values = df[removed_col].tolist() if removed_col else [None] * len(df)
+
+            for date_val, added_val, removed_val in zip(date_values, added_values, removed_values):
+                if pd.isna(date_val):
+                    continue
+                effective_date = self._parse_date(str(date_val))
                 if effective_date is None:
                     continue
 
                 # Handle added stocks - record their add date
-                added_ticker = self._find_added_ticker(row)
+                added_ticker = self._ticker_from_cell(added_val)
                 if added_ticker:
                     added_dates[added_ticker] = effective_date
 
                 # Handle removed stocks - record their remove date
-                removed_ticker = self._find_removed_ticker(row)
+                removed_ticker = self._ticker_from_cell(removed_val)
                 if removed_ticker:
                     removed_dates[removed_ticker] = effective_date
 
@@ -156,41 +227,31 @@ class NASDAQ100Scraper(BaseScraper):
 
         return added_dates, removed_dates
 
-    def _find_date(self, row: pd.Series) -> Optional[date]:
-        """Find and parse date from row."""
-        for col in row.index:
-            col_lower = str(col).lower()
-            if "date" in col_lower:
-                val = row[col]
-                if pd.notna(val):
-                    return self._parse_date(str(val))
-        return None
-
-    def _find_removed_ticker(self, row: pd.Series) -> Optional[str]:
-        """Find removed ticker from row."""
-        for col in row.index:
-            col_lower = str(col).lower()
-            if "removed" in col_lower and "ticker" in col_lower:
-                val = row[col]
-                if pd.notna(val) and str(val).strip() and str(val).strip() != "nan":
-                    return str(val).strip()
-        return None
-
-    def _find_added_ticker(self, row: pd.Series) -> Optional[str]:
-        """Find added ticker from row."""
-        for col in row.index:
-            col_lower = str(col).lower()
-            if "added" in col_lower and "ticker" in col_lower:
-                val = row[col]
-                if pd.notna(val) and str(val).strip() and str(val).strip() != "nan":
-                    return str(val).strip()
-        return None
-
-    def _parse_date(self, date_str: str) -> Optional[date]:
-        """Parse date string."""
+    @staticmethod
+    def _ticker_from_cell(val: object) -> Optional[str]:
+        """Extract a ticker from a cell value, or None for blank/NaN cells."""
+        if pd.isna(val):
+            return None
+        ticker = str(val).strip()
+        if not ticker or ticker == "nan":
+            return None
+        return ticker
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_date(date_str: str) -> Optional[date]:
+        """Parse date string.
+
+        Memoized: many changes-table rows share the same effective date,
+        so repeated strings skip the strptime work entirely.
+        """
         date_str = date_str.strip()
-        formats = ["%B %d, %Y", "%b %d, %Y", "%Y-%m-%d"]
-        for fmt in formats:
+        # C-implemented fast path for YYYY-MM-DD
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+        for fmt in _DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt).date()
             except ValueError:
@@ -1,16 +1,30 @@
 """S&P 500 Wikipedia scraper."""
 
 from datetime import datetime, date
+from functools import lru_cache
 from io import StringIO
 from typing import Optional
 
 import pandas as pd
 from bs4 import BeautifulSoup, Tag
-from curl_cffi import requests
+from bs4.filter import SoupStrainer
 
+from stock_index_info.http_client import get_session
 from stock_index_info.models import ConstituentRecord
 from stock_index_info.scrapers.base import BaseScraper
 
+# Textual date formats used by Wikipedia change tables; ISO dates take a
+# separate fast path through date.fromisoformat
+_DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y")
+
+# Translation table for normalizing column names (spaces to underscores)
+_COL_TRANS = str.maketrans(" ", "_")
+
+# Build the soup from the wikitables only, skipping the rest of the page
+# (nav, infoboxes, references). The class attribute is still a raw string
+# while parsing, so match it with a callable instead of class_="wikitable"
+_WIKITABLE_STRAINER = SoupStrainer("table", class_=lambda c: bool(c) and "wikitable" in c.split())
+
 
 class SP500Scraper(BaseScraper):
     """Scrapes S&P 500 constituent data from Wikipedia."""
@@ -27,10 +41,24 @@ class SP500Scraper(BaseScraper):
 
     def fetch(self) -> list[ConstituentRecord]:
         """Fetch current constituents and historical changes."""
-        response = requests.get(self.WIKI_URL, impersonate="chrome", timeout=30.0)
+        # Revalidate against the last scrape's validators so an unchanged
+        # page comes back as a bodyless 304 and skips all parsing
+        cached = self._load_scrape_cache()
+        headers: dict[str, str] = {}
+        if cached is not None:
+            cached_etag, cached_last_modified, _ = cached
+            if cached_etag:
+                headers["If-None-Match"] = cached_etag
+            if cached_last_modified:
+                headers["If-Modified-Since"] = cached_last_modified
+
+        response = get_session().get(self.WIKI_URL, headers=headers or None, timeout=30.0)
+        if response.status_code == 304 and cached is not None:
+            return cached[2]
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        # lxml (libxml2) parses the ~500 KB page far faster than html.parser
+        soup = BeautifulSoup(response.text, "lxml", parse_only=_WIKITABLE_STRAINER)
         tables = soup.find_all("table", class_="wikitable")
 
         # First pass: parse changes table to collect all add/remove events
@@ -66,53 +94,59 @@ class SP500Scraper(BaseScraper):
                     )
                 )
 
+        # Persist the result only when the response carries validators;
+        # without them the next request can't revalidate anyway
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if isinstance(etag, str) or isinstance(last_modified, str):
+            self._save_scrape_cache(etag, last_modified, records)
+
         return records
 
     def _parse_current_table(
         self, table: Tag, added_dates: dict[str, date]
     ) -> list[ConstituentRecord]:
-        """Parse the current S&P 500 constituents table."""
+        """Parse the current S&P 500 constituents table.
+
+        Walks the rows directly with BeautifulSoup; the simple single-header
+        layout doesn't need a pandas re-parse of the serialized table.
+        """
         records: list[ConstituentRecord] = []
 
         try:
-            df = pd.read_html(StringIO(str(table)))[0]
-            # Normalize column names
-            df.columns = [str(c).lower().replace(" ", "_") for c in df.columns]
-
-            for _, row in df.iterrows():
-                # Try different column names for ticker
-                ticker = None
-                for col_name in ["symbol", "ticker"]:
-                    if col_name in row.index:
-                        ticker = str(row[col_name]).strip()
-                        if ticker and ticker != "nan":
-                            break
-
-                if not ticker or ticker == "nan":
+            rows = table.find_all("tr")
+            if not rows:
+                return []
+
+            headers = [th.get_text(strip=True).lower() for th in rows[0].find_all("th")]
+
+            ticker_idx = next((i for i, h in enumerate(headers) if h in ("symbol", "ticker")), None)
+            if ticker_idx is None:
+                return []
+            company_idx = next(
+                (i for i, h in enumerate(headers) if h in ("security", "company")), None
+            )
+            date_idx = next((i for i, h in enumerate(headers) if h == "date added"), None)
+
+            for row in rows[1:]:
+                cells = row.find_all(["td", "th"])
+                if len(cells) <= ticker_idx:
                     continue
 
-                # Try to get date from current table first, then from changes table
-                added_date = None
+                ticker = cells[ticker_idx].get_text(strip=True)
+                if not ticker:
+                    continue
 
-                # Try different column names for date in current table
-                for col_name in ["date_added", "date added"]:
-                    if col_name in row.index:
-                        added_str = str(row[col_name])
-                        try:
-                            added_date = datetime.strptime(added_str, "%Y-%m-%d").date()
-                            break
-                        except (ValueError, TypeError):
-                            pass
-
-                # Fall back to changes table if not found in current table
+                # Prefer the date from the current table, then the changes table
+                added_date = None
+                if date_idx is not None and len(cells) > date_idx:
+                    added_date = self._parse_date(cells[date_idx].get_text(strip=True))
                 if added_date is None:
                     added_date = added_dates.get(ticker)
 
                 company_name = ""
-                for col_name in ["security", "company"]:
-                    if col_name in row.index:
-                        company_name = str(row[col_name])
-                        break
+                if company_idx is not None and len(cells) > company_idx:
+                    company_name = cells[company_idx].get_text(strip=True)
 
                 records.append(
                     ConstituentRecord(
@@ -120,7 +154,7 @@ class SP500Scraper(BaseScraper):
                         index_code=self.index_code,
                         added_date=added_date,
                         removed_date=None,
-                        company_name=company_name if company_name != "nan" else None,
+                        company_name=company_name or None,
                     )
                 )
         except Exception:
@@ -141,31 +175,49 @@ class SP500Scraper(BaseScraper):
         removed_dates: dict[str, date] = {}
 
         try:
-            df = pd.read_html(StringIO(str(table)))[0]
+            df = pd.read_html(StringIO(str(table)), flavor="lxml")[0]
             # Flatten multi-level columns if present
             if isinstance(df.columns, pd.MultiIndex):
                 df.columns = ["_".join(map(str, col)).strip() for col in df.columns]
 
             # Normalize column names
-            df.columns = [str(c).lower().replace(" ", "_") for c in df.columns]
-
-            for _, row in df.iterrows():
-                # Parse effective date
-                date_str = self._find_date_column(row)
-                if not date_str:
+            df.columns = [str(c).lower().translate(_COL_TRANS) for c in df.columns]
+
+            # Resolve the relevant columns once instead of scanning every
+            # column name again for every row
+            date_col = next((c for c in df.columns if "date" in c), None)
+            added_col = next(
+                (c for c in df.columns if "added" in c and ("ticker" in c or "symbol" in c)),
+                None,
+            )
+            removed_col = next(
+                (c for c in df.columns if "removed" in c and ("ticker" in c or "symbol" in c)),
+                None,
+            )
+
+            if date_col is None or (added_col is None and removed_col is None):
+                return {}, {}
+
+            # Zip plain column lists instead of iterrows(), which boxes
+            # every row into a Series
+            date_values = df[date_col].tolist()
+            added_values = df[added_col].tolist() if added_col else [None] * len(df)
+            removed_values = df[removed_col].tolist() if removed_col else [None] * len(df)
+
+            for date_val, added_val, removed_val in zip(date_values, added_values, removed_values):
+                if pd.isna(date_val):
                     continue
-
-                effective_date = self._parse_date(date_str)
+                effective_date = self._parse_date(str(date_val))
                 if effective_date is None:
                     continue
 
                 # Handle added stocks - record their add date
-                added_ticker = self._find_added_ticker(row)
+                added_ticker = self._ticker_from_cell(added_val)
                 if added_ticker:
                     added_dates[added_ticker] = effective_date
 
                 # Handle removed stocks - record their remove date
-                removed_ticker = self._find_removed_ticker(row)
+                removed_ticker = self._ticker_from_cell(removed_val)
                 if removed_ticker:
                     removed_dates[removed_ticker] = effective_date
 
@@ -174,45 +226,31 @@ class SP500Scraper(BaseScraper):
 
         return added_dates, removed_dates
 
-    def _find_date_column(self, row: pd.Series) -> Optional[str]:
-        """Find the date value in a row."""
-        for col in row.index:
-            col_lower = str(col).lower()
-            if "date" in col_lower:
-                val = row[col]
-                if pd.notna(val):
-                    return str(val)
-        return None
-
-    def _find_added_ticker(self, row: pd.Series) -> Optional[str]:
-        """Find the added ticker in a row."""
-        for col in row.index:
-            col_lower = str(col).lower()
-            if "added" in col_lower and ("ticker" in col_lower or "symbol" in col_lower):
-                val = row[col]
-                if pd.notna(val) and str(val).strip() and str(val).strip() != "nan":
-                    return str(val).strip()
-        return None
-
-    def _find_removed_ticker(self, row: pd.Series) -> Optional[str]:
-        """Find the removed ticker in a row."""
-        for col in row.index:
-            col_lower = str(col).lower()
-            if "removed" in col_lower and ("ticker" in col_lower or "symbol" in col_lower):
-                val = row[col]
-                if pd.notna(val) and str(val).strip() and str(val).strip() != "nan":
-                    return str(val).strip()
-        return None
-
-    def _parse_date(self, date_str: str) -> Optional[date]:
-        """Parse various date formats from Wikipedia."""
+    @staticmethod
+    def _ticker_from_cell(val: object) -> Optional[str]:
+        """Extract a ticker from a cell value, or None for blank/NaN cells."""
+        if pd.isna(val):
+            return None
+        ticker = str(val).strip()
+        if not ticker or ticker == "nan":
+            return None
+        return ticker
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_date(date_str: str) -> Optional[date]:
+        """Parse various date formats from Wikipedia.
+
+        Memoized: many changes-table rows share the same effective date,
+        so repeated strings skip the strptime work entirely.
+        """
         date_str = date_str.strip()
-        formats = [
-            "%B %d, %Y",  # December 22, 2024
-            "%b %d, %Y",  # Dec 22, 2024
-            "%Y-%m-%d",  # 2024-12-22
-        ]
-        for fmt in formats:
+        # C-implemented fast path for YYYY-MM-DD
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+        for fmt in _DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt).date()
             except ValueError:
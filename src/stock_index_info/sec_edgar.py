@@ -6,6 +6,7 @@ from typing import Optional
 
 from curl_cffi import requests
 
+from stock_index_info.http_client import get_session
 from stock_index_info.models import SECFilingRecord, RecentFilings
 
 logger = logging.getLogger(__name__)
@@ -14,24 +15,34 @@ logger = logging.getLogger(__name__)
 # SEC requires a User-Agent header with contact info
 SEC_USER_AGENT = "StockIndexInfoBot contact@example.com"
 
+# Cache expiration for the ticker->CIK map (24 hours); the SEC file is
+# ~1 MB and changes rarely, so one download serves many lookups
+_CIK_MAP_EXPIRATION_SECONDS = 24 * 60 * 60
 
-def get_cik_from_ticker(ticker: str) -> Optional[str]:
-    """Get CIK (Central Index Key) from ticker symbol.
+# Cached (ticker -> CIK) map and the Unix time it was fetched
+_cik_map_cache: Optional[tuple[dict[str, str], float]] = None
 
-    Args:
-        ticker: Stock ticker symbol (e.g., "AAPL")
+
+def _get_cik_map() -> Optional[dict[str, str]]:
+    """Fetch and cache the SEC ticker->CIK map.
 
     Returns:
-        CIK as string without leading zeros, or None if not found
+        Dict mapping upper-case ticker to CIK string, or None if the
+        download fails and no cached copy exists.
     """
-    ticker_upper = ticker.upper()
-    url = "https://www.sec.gov/files/company_tickers.json"
+    global _cik_map_cache
+
+    if _cik_map_cache is not None:
+        cik_map, timestamp = _cik_map_cache
+        if time.time() - timestamp < _CIK_MAP_EXPIRATION_SECONDS:
+            return cik_map
 
-    logger.info(f"[API] get_cik_from_ticker({ticker_upper}): requesting SEC company tickers")
+    url = "https://www.sec.gov/files/company_tickers.json"
+    logger.info(f"[API] get_cik_from_ticker(): requesting SEC company tickers from {url}")
     start_time = time.time()
 
     try:
-        response = requests.get(
+        response = get_session().get(
             url,
             headers={"User-Agent": SEC_USER_AGENT},
             timeout=30,
@@ -41,35 +52,67 @@ def get_cik_from_ticker(ticker: str) -> Optional[str]:
         data = response.json()
 
         logger.info(
-            f"[API] get_cik_from_ticker({ticker_upper}): "
+            f"[API] get_cik_from_ticker(): "
             f"response status={response.status_code}, elapsed={elapsed_ms:.0f}ms"
         )
 
         # Data format: {"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}, ...}
-        for entry in data.values():
-            if entry.get("ticker") == ticker_upper:
-                cik = str(entry["cik_str"])
-                logger.info(f"[API] get_cik_from_ticker({ticker_upper}): found CIK={cik}")
-                return cik
-
-        logger.warning(f"[API] get_cik_from_ticker({ticker_upper}): ticker not found in SEC data")
-        return None
+        cik_map = {
+            entry["ticker"]: str(entry["cik_str"]) for entry in data.values() if entry.get("ticker")
+        }
+        _cik_map_cache = (cik_map, time.time())
+        logger.info(f"[API] get_cik_from_ticker(): cached CIK map for {len(cik_map)} tickers")
+        return cik_map
     except requests.RequestsError as e:
         elapsed_ms = (time.time() - start_time) * 1000
         logger.error(
-            f"[API] get_cik_from_ticker({ticker_upper}): "
+            f"[API] get_cik_from_ticker(): "
             f"request failed after {elapsed_ms:.0f}ms - {type(e).__name__}: {e}"
         )
-        return None
     except Exception as e:
         elapsed_ms = (time.time() - start_time) * 1000
         logger.error(
-            f"[API] get_cik_from_ticker({ticker_upper}): "
+            f"[API] get_cik_from_ticker(): "
             f"unexpected error after {elapsed_ms:.0f}ms - {type(e).__name__}: {e}",
             exc_info=True,
         )
+
+    # Refresh failed: serve the expired map rather than failing the lookup
+    if _cik_map_cache is not None:
+        logger.warning("[API] get_cik_from_ticker(): refresh failed, using stale CIK map")
+        return _cik_map_cache[0]
+    return None
+
+
+def get_cik_from_ticker(ticker: str) -> Optional[str]:
+    """Get CIK (Central Index Key) from ticker symbol.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., "AAPL")
+
+    Returns:
+        CIK as string without leading zeros, or None if not found
+    """
+    ticker_upper = ticker.upper()
+
+    cik_map = _get_cik_map()
+    if cik_map is None:
+        return None
+
+    cik = cik_map.get(ticker_upper)
+    if cik is None:
+        logger.warning(f"[API] get_cik_from_ticker({ticker_upper}): ticker not found in SEC data")
         return None
 
+    logger.info(f"[API] get_cik_from_ticker({ticker_upper}): found CIK={cik}")
+    return cik
+
+
+def clear_cik_map_cache() -> None:
+    """Clear the cached CIK map. Useful for testing or long-running processes."""
+    global _cik_map_cache
+    _cik_map_cache = None
+
 
 def get_latest_10q(ticker: str) -> Optional[SECFilingRecord]:
     """Get the latest 10-Q filing for a stock.
@@ -97,7 +140,7 @@ def get_latest_10q(ticker: str) -> Optional[SECFilingRecord]:
     start_time = time.time()
 
     try:
-        response = requests.get(
+        response = get_session().get(
             url,
             headers={"User-Agent": SEC_USER_AGENT},
             timeout=30,
@@ -118,11 +161,13 @@ def get_latest_10q(ticker: str) -> Optional[SECFilingRecord]:
         filing_dates = recent_filings.get("filingDate", [])
         primary_documents = recent_filings.get("primaryDocument", [])
 
-        for i, form in enumerate(forms):
+        # Zip the parallel arrays instead of indexing them per iteration;
+        # this also stops at the shortest array if their lengths disagree
+        for form, accession_number, filing_date, primary_doc in zip(
+            forms, accession_numbers, filing_dates, primary_documents
+        ):
             if form == "10-Q":
-                accession = accession_numbers[i].replace("-", "")
-                filing_date = filing_dates[i]
-                primary_doc = primary_documents[i]
+                accession = accession_number.replace("-", "")
 
                 filing_url = (
                     f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{primary_doc}"
@@ -183,7 +228,7 @@ def get_recent_filings(ticker: str) -> Optional[RecentFilings]:
     start_time = time.time()
 
     try:
-        response = requests.get(
+        response = get_session().get(
             url,
             headers={"User-Agent": SEC_USER_AGENT},
             timeout=30,
@@ -207,10 +252,12 @@ def get_recent_filings(ticker: str) -> Optional[RecentFilings]:
         quarterly: list[SECFilingRecord] = []
         annual: Optional[SECFilingRecord] = None
 
-        for i, form in enumerate(forms):
-            accession = accession_numbers[i].replace("-", "")
-            filing_date = filing_dates[i]
-            primary_doc = primary_documents[i]
+        # Zip the parallel arrays instead of indexing them per iteration;
+        # this also stops at the shortest array if their lengths disagree
+        for form, accession_number, filing_date, primary_doc in zip(
+            forms, accession_numbers, filing_dates, primary_documents
+        ):
+            accession = accession_number.replace("-", "")
 
             filing_url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{primary_doc}"
 
@@ -47,6 +47,32 @@ def test_fetch_annual_net_income_no_api_key(monkeypatch):
     assert records is None
 
 
+def test_fetch_annual_net_income_bulk_no_api_key(monkeypatch):
+    """Test that the bulk fetcher returns None per ticker when API key not configured."""
+    from stock_index_info import alpha_vantage
+    from stock_index_info.alpha_vantage import fetch_annual_net_income_bulk
+
+    monkeypatch.setattr(alpha_vantage, "ALPHA_VANTAGE_API_KEY", None)
+
+    results = fetch_annual_net_income_bulk(["aapl", "MSFT"])
+    assert results == {"AAPL": None, "MSFT": None}
+
+
+def test_get_market_cap_uses_cache():
+    """Test that a recent cached market cap is served without a network call."""
+    import time
+
+    from stock_index_info import alpha_vantage
+    from stock_index_info.alpha_vantage import get_market_cap, clear_market_cap_cache
+
+    clear_market_cap_cache()
+    try:
+        alpha_vantage._market_cap_cache["CACHED"] = (123_000_000_000.0, time.time())
+        assert get_market_cap("cached") == 123_000_000_000.0
+    finally:
+        clear_market_cap_cache()
+
+
 def test_get_market_cap_valid_ticker():
     """Test getting market cap for a valid ticker."""
     from stock_index_info.alpha_vantage import get_market_cap
@@ -180,6 +206,37 @@ def test_get_7year_pe_with_cache(db_connection):
     assert abs(result.avg_income - 100_000_000) < 0.01
 
 
+def test_get_7year_pe_bulk_with_cache(db_connection):
+    """Test the batch driver computes P/E from prefetched cache rows."""
+    from stock_index_info.alpha_vantage import get_7year_pe_bulk
+    from stock_index_info.db import save_income
+    from stock_index_info.models import IncomeRecord
+
+    # Pre-populate cache: AAA has 7 consecutive years, BBB only 1
+    aaa_records = [
+        IncomeRecord(ticker="AAA", fiscal_year=year, net_income=100_000_000)
+        for year in range(2024, 2017, -1)
+    ]
+    save_income(db_connection, "AAA", aaa_records, "2025-01-15")
+    save_income(
+        db_connection,
+        "BBB",
+        [IncomeRecord(ticker="BBB", fiscal_year=2024, net_income=100_000_000)],
+        "2025-01-15",
+    )
+
+    results = get_7year_pe_bulk(
+        db_connection,
+        ["aaa", "BBB"],
+        market_caps={"AAA": 2_000_000_000.0, "BBB": 2_000_000_000.0},
+    )
+
+    assert set(results) == {"AAA", "BBB"}
+    assert results["AAA"] is not None
+    assert abs(results["AAA"].pe - 20.0) < 0.01
+    assert results["BBB"] is None  # Insufficient history
+
+
 def test_fetch_annual_net_income_non_usd_currency():
     """Test fetching net income for a non-USD reporting company (NVO reports in DKK)."""
     from stock_index_info.config import ALPHA_VANTAGE_API_KEY
@@ -44,6 +44,29 @@ def test_get_cached_balance_sheet_not_found(db_connection):
     assert cached is None
 
 
+def test_get_cached_balance_sheet_bulk(db_connection):
+    """Test fetching cached balance sheets for many tickers with one query."""
+    from stock_index_info.db import get_cached_balance_sheet_bulk
+
+    record = BalanceSheetRecord(
+        ticker="AAA",
+        fiscal_year=2024,
+        total_assets=100_000_000,
+        total_liabilities=50_000_000,
+        total_current_assets=30_000_000,
+        goodwill=5_000_000,
+        intangible_assets=3_000_000,
+    )
+    save_balance_sheet(db_connection, "AAA", [record], "2025-01-15")
+
+    cached = get_cached_balance_sheet_bulk(db_connection, ["aaa", "NOTFOUND"])
+
+    assert set(cached) == {"AAA"}
+    assert cached["AAA"].last_updated == "2025-01-15"
+    assert cached["AAA"].annual_records[0].total_assets == 100_000_000
+    assert get_cached_balance_sheet_bulk(db_connection, []) == {}
+
+
 def test_save_balance_sheet_replaces_existing(db_connection):
     """Test that saving balance sheet replaces existing data."""
     old_records = [
@@ -67,6 +67,19 @@ class TestConstituents:
         sp500_current = get_index_constituents(db_connection, "sp500")
         assert set(sp500_current) == {"AAPL", "MSFT"}
 
+    def test_insert_constituents_batch(self, db_connection: sqlite3.Connection) -> None:
+        from stock_index_info.db import insert_constituents
+
+        records = [
+            ConstituentRecord("AAPL", "sp500", date(1982, 11, 30)),
+            ConstituentRecord("MSFT", "sp500", date(1994, 6, 1)),
+            ConstituentRecord("AAPL", "sp500", date(1982, 11, 30)),  # Duplicate ignored
+        ]
+        insert_constituents(db_connection, records)
+
+        sp500_current = get_index_constituents(db_connection, "sp500")
+        assert set(sp500_current) == {"AAPL", "MSFT"}
+
 
 def test_save_and_get_income(db_connection):
     """Test saving and retrieving income statement data."""
@@ -89,6 +102,63 @@ def test_save_and_get_income(db_connection):
     assert cached.annual_income[0].net_income == 96995000000
 
 
+def test_get_cached_income_bulk(db_connection):
+    """Test fetching cached income for many tickers with one query."""
+    from stock_index_info.db import save_income, get_cached_income_bulk
+    from stock_index_info.models import IncomeRecord
+
+    save_income(
+        db_connection,
+        "AAPL",
+        [IncomeRecord(ticker="AAPL", fiscal_year=2024, net_income=96995000000)],
+        "2025-01-15",
+    )
+    save_income(
+        db_connection,
+        "MSFT",
+        [IncomeRecord(ticker="MSFT", fiscal_year=2024, net_income=88136000000)],
+        "2025-01-10",
+    )
+
+    cached = get_cached_income_bulk(db_connection, ["aapl", "MSFT", "NOTFOUND"])
+
+    assert set(cached) == {"AAPL", "MSFT"}
+    assert cached["AAPL"].last_updated == "2025-01-15"
+    assert cached["AAPL"].annual_income[0].net_income == 96995000000
+    assert cached["MSFT"].last_updated == "2025-01-10"
+
+
+def test_get_cached_income_bulk_empty(db_connection):
+    """Test that the bulk getter handles an empty ticker list."""
+    from stock_index_info.db import get_cached_income_bulk
+
+    assert get_cached_income_bulk(db_connection, []) == {}
+
+
+def test_save_income_bulk(db_connection):
+    """Test saving income for many tickers in one transaction."""
+    from stock_index_info.db import save_income_bulk, get_cached_income
+    from stock_index_info.models import IncomeRecord
+
+    save_income_bulk(
+        db_connection,
+        {
+            "AAPL": [
+                IncomeRecord(ticker="AAPL", fiscal_year=2024, net_income=96995000000),
+                IncomeRecord(ticker="AAPL", fiscal_year=2023, net_income=96995000000),
+            ],
+            "MSFT": [IncomeRecord(ticker="MSFT", fiscal_year=2024, net_income=88136000000)],
+        },
+        "2025-01-15",
+    )
+
+    aapl = get_cached_income(db_connection, "AAPL")
+    msft = get_cached_income(db_connection, "MSFT")
+    assert aapl is not None and len(aapl.annual_income) == 2
+    assert msft is not None and len(msft.annual_income) == 1
+    assert aapl.last_updated == "2025-01-15"
+
+
 def test_get_cached_income_not_found(db_connection):
     """Test getting income for non-existent ticker returns None."""
     from stock_index_info.db import get_cached_income
@@ -97,6 +167,36 @@ def test_get_cached_income_not_found(db_connection):
     assert cached is None
 
 
+def test_get_cached_income_memoized_per_connection(db_connection):
+    """Test that repeat lookups reuse the in-memory memo and writes invalidate it."""
+    from stock_index_info.db import save_income, get_cached_income
+    from stock_index_info.models import IncomeRecord
+
+    save_income(
+        db_connection,
+        "AAPL",
+        [IncomeRecord(ticker="AAPL", fiscal_year=2024, net_income=96995000000)],
+        "2025-01-15",
+    )
+
+    first = get_cached_income(db_connection, "AAPL")
+    second = get_cached_income(db_connection, "AAPL")
+    assert first is not None
+    assert second is first  # Memo hit returns the same object
+
+    # A write must invalidate the memo so the next read sees fresh data
+    save_income(
+        db_connection,
+        "AAPL",
+        [IncomeRecord(ticker="AAPL", fiscal_year=2025, net_income=100000000000)],
+        "2026-01-15",
+    )
+    refreshed = get_cached_income(db_connection, "AAPL")
+    assert refreshed is not None
+    assert refreshed.last_updated == "2026-01-15"
+    assert refreshed.annual_income[0].fiscal_year == 2025
+
+
 def test_save_income_replaces_old_data(db_connection):
     """Test that saving income replaces existing data for ticker."""
     from stock_index_info.db import save_income, get_cached_income
@@ -90,6 +90,88 @@ def test_convert_to_usd_eur():
     assert abs(result - expected) < 0.01
 
 
+def test_get_usd_conversion_rate_usd():
+    """Test that USD returns a factor of 1.0 without hitting the API."""
+    from stock_index_info.exchange_rate import get_usd_conversion_rate
+
+    assert get_usd_conversion_rate("USD") == 1.0
+
+
+def test_get_usd_conversion_rate_from_cached_rates():
+    """Test that the factor is the reciprocal of the cached rate."""
+    import time
+
+    from stock_index_info import exchange_rate
+    from stock_index_info.exchange_rate import (
+        get_usd_conversion_rate,
+        clear_exchange_rate_cache,
+    )
+
+    clear_exchange_rate_cache()
+    try:
+        exchange_rate._exchange_rates_cache = exchange_rate._ExchangeRateCache(
+            rates={"USD": 1.0, "DKK": 7.0},
+            timestamp=time.time(),
+        )
+        factor = get_usd_conversion_rate("DKK")
+        assert factor is not None
+        assert abs(factor - 1.0 / 7.0) < 1e-12
+        assert get_usd_conversion_rate("INVALID_CURRENCY") is None
+    finally:
+        clear_exchange_rate_cache()
+
+
+def test_exchange_rate_cache_disk_round_trip(tmp_path, monkeypatch):
+    """Test that persisted rates are reloaded after the in-memory cache clears."""
+    import time
+
+    from stock_index_info import exchange_rate
+    from stock_index_info.exchange_rate import get_exchange_rates, clear_exchange_rate_cache
+
+    monkeypatch.setattr(exchange_rate, "_CACHE_FILE_PATH", tmp_path / "exchange_rates.json")
+
+    clear_exchange_rate_cache()
+    try:
+        cache = exchange_rate._ExchangeRateCache(
+            rates={"USD": 1.0, "EUR": 0.9},
+            timestamp=time.time(),
+        )
+        exchange_rate._save_cache_to_disk(cache)
+
+        # Simulate a restart: memory cache empty, disk cache present
+        clear_exchange_rate_cache()
+        rates = get_exchange_rates()
+
+        assert rates == {"USD": 1.0, "EUR": 0.9}
+    finally:
+        clear_exchange_rate_cache()
+
+
+def test_get_exchange_rates_serves_stale_on_refresh_failure(monkeypatch):
+    """Test that expired rates are still served when the refresh fails."""
+    import time
+
+    from stock_index_info import exchange_rate
+    from stock_index_info.exchange_rate import get_exchange_rates, clear_exchange_rate_cache
+
+    clear_exchange_rate_cache()
+    try:
+        expired = time.time() - exchange_rate._CACHE_EXPIRATION_SECONDS - 60
+        exchange_rate._exchange_rates_cache = exchange_rate._ExchangeRateCache(
+            rates={"USD": 1.0, "DKK": 7.0},
+            timestamp=expired,
+        )
+        monkeypatch.setattr(exchange_rate, "_fetch_fresh", lambda: None)
+
+        rates = get_exchange_rates()
+
+        assert rates == {"USD": 1.0, "DKK": 7.0}
+        # Timestamp was pushed forward so the next retry waits out the backoff
+        assert exchange_rate._exchange_rates_cache.timestamp > expired
+    finally:
+        clear_exchange_rate_cache()
+
+
 def test_convert_to_usd_unknown_currency():
     """Test conversion with unknown currency returns None."""
     from stock_index_info.exchange_rate import convert_to_usd, clear_exchange_rate_cache
@@ -29,14 +29,14 @@ class TestNASDAQ100Scraper:
         assert scraper.index_code == "nasdaq100"
         assert scraper.index_name == "NASDAQ 100"
 
-    @patch("stock_index_info.scrapers.nasdaq100.requests.get")
-    def test_fetch_finds_current_constituents(self, mock_get: MagicMock) -> None:
+    @patch("stock_index_info.scrapers.nasdaq100.get_session")
+    def test_fetch_finds_current_constituents(self, mock_get_session: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.text = (
             f"<html><body>{SAMPLE_CURRENT_TABLE_HTML}{SAMPLE_CHANGES_TABLE_HTML}</body></html>"
         )
         mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         scraper = NASDAQ100Scraper()
         records = scraper.fetch()
@@ -45,14 +45,14 @@ class TestNASDAQ100Scraper:
         assert "AAPL" in tickers
         assert "GOOGL" in tickers
 
-    @patch("stock_index_info.scrapers.nasdaq100.requests.get")
-    def test_fetch_parses_changes(self, mock_get: MagicMock) -> None:
+    @patch("stock_index_info.scrapers.nasdaq100.get_session")
+    def test_fetch_parses_changes(self, mock_get_session: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.text = (
             f"<html><body>{SAMPLE_CURRENT_TABLE_HTML}{SAMPLE_CHANGES_TABLE_HTML}</body></html>"
         )
         mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         scraper = NASDAQ100Scraper()
         records = scraper.fetch()
@@ -31,14 +31,14 @@ class TestSP500Scraper:
         assert scraper.index_code == "sp500"
         assert scraper.index_name == "S&P 500"
 
-    @patch("stock_index_info.scrapers.sp500.requests.get")
-    def test_fetch_current_constituents(self, mock_get: MagicMock) -> None:
+    @patch("stock_index_info.scrapers.sp500.get_session")
+    def test_fetch_current_constituents(self, mock_get_session: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.text = (
             f"<html><body>{SAMPLE_CURRENT_TABLE_HTML}{SAMPLE_CHANGES_TABLE_HTML}</body></html>"
         )
         mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         scraper = SP500Scraper()
         records = scraper.fetch()
@@ -53,14 +53,44 @@ class TestSP500Scraper:
         assert aapl.added_date == date(1982, 11, 30)
         assert aapl.index_code == "sp500"
 
-    @patch("stock_index_info.scrapers.sp500.requests.get")
-    def test_fetch_parses_changes(self, mock_get: MagicMock) -> None:
+    @patch("stock_index_info.scrapers.sp500.get_session")
+    def test_fetch_returns_cached_records_on_304(
+        self, mock_get_session: MagicMock, monkeypatch, tmp_path
+    ) -> None:
+        from stock_index_info.models import ConstituentRecord
+        from stock_index_info.scrapers import base
+
+        monkeypatch.setattr(base, "DATA_DIR", tmp_path)
+
+        scraper = SP500Scraper()
+        cached_records = [
+            ConstituentRecord(ticker="AAPL", index_code="sp500", added_date=date(1982, 11, 30))
+        ]
+        scraper._save_scrape_cache('"abc123"', "Mon, 01 Jan 2024 00:00:00 GMT", cached_records)
+
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+        mock_get_session.return_value.get.return_value = mock_response
+
+        records = scraper.fetch()
+
+        # Cached records come back without any parsing
+        assert [r.ticker for r in records] == ["AAPL"]
+        assert records[0].added_date == date(1982, 11, 30)
+
+        # The request carried the stored validators
+        headers = mock_get_session.return_value.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc123"'
+        assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    @patch("stock_index_info.scrapers.sp500.get_session")
+    def test_fetch_parses_changes(self, mock_get_session: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.text = (
             f"<html><body>{SAMPLE_CURRENT_TABLE_HTML}{SAMPLE_CHANGES_TABLE_HTML}</body></html>"
         )
         mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
 
         scraper = SP500Scraper()
         records = scraper.fetch()
@@ -27,6 +27,23 @@ def test_get_cik_from_ticker_case_insensitive():
     assert cik_upper == cik_lower
 
 
+def test_get_cik_from_ticker_uses_cached_map():
+    """Test that lookups hit the cached CIK map without refetching."""
+    import time
+
+    from stock_index_info import sec_edgar
+    from stock_index_info.sec_edgar import clear_cik_map_cache, get_cik_from_ticker
+
+    clear_cik_map_cache()
+    try:
+        sec_edgar._cik_map_cache = ({"AAPL": "320193"}, time.time())
+        assert get_cik_from_ticker("AAPL") == "320193"
+        assert get_cik_from_ticker("aapl") == "320193"
+        assert get_cik_from_ticker("NOTINMAP") is None
+    finally:
+        clear_cik_map_cache()
+
+
 def test_get_latest_10q_valid_ticker():
     """Test getting latest 10-Q for a valid ticker."""
     from stock_index_info.sec_edgar import get_latest_10q